@@ -37,6 +37,7 @@ from cairo_parser.analysis import (
     # Statements
     Statement,
     StatementParser,
+    StatementBatch,
     AssignmentStmt,
     LetBindingStmt,
     IfStmt,
@@ -75,6 +76,7 @@ __all__ = [
     # Statements
     "Statement",
     "StatementParser",
+    "StatementBatch",
     "AssignmentStmt",
     "LetBindingStmt",
     "IfStmt",
@@ -8,7 +8,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 # Import parser
 from cairo_parser.parser import CairoParser, ContractInfo
@@ -16,7 +16,9 @@ from cairo_parser.parser import CairoParser, ContractInfo
 # Import analyzer
 from cairo_parser.analysis.analyzer import CairoAnalyzer
 from cairo_parser.analysis.serialization import (
+    YAML_AVAILABLE,
     save_analysis,
+    serialize_to_yaml,
     format_summary_text,
     format_warnings_text,
 )
@@ -168,8 +170,8 @@ def contract_to_dict(contract: ContractInfo) -> dict:
     }
 
 
-def main():
-    """Main CLI entry point."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(
         description='Parse Cairo smart contracts with dependency stubbing',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -211,7 +213,7 @@ Examples:
     parser.add_argument('--show-warnings', action='store_true',
                         help='Display analysis warnings in summary output')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Find Cairo files
     cairo_files = find_cairo_files(args.paths)
@@ -220,8 +222,8 @@ Examples:
     input_files = [Path(p) for p in args.paths if Path(p).is_file()]
     input_dirs = [Path(p) for p in args.paths if Path(p).is_dir()]
 
-    # Initialize parser
-    cairo_parser = CairoParser()
+    # Initialize parser; function bodies are only needed for analysis
+    cairo_parser = CairoParser(extract_bodies=args.analyze)
 
     # Determine parsing strategy
     stub_missing = not args.no_stub
@@ -356,9 +358,7 @@ Examples:
         output = json.dumps(output_data, indent=2)
 
     elif args.format == 'yaml':
-        try:
-            import yaml
-        except ImportError:
+        if not YAML_AVAILABLE:
             print("Error: YAML format requires pyyaml: pip install pyyaml", file=sys.stderr)
             return 1
 
@@ -383,7 +383,7 @@ Examples:
             analyzer = CairoAnalyzer()
             output_data['analysis_summary'] = analyzer.get_summary_stats(analysis_results)
 
-        output = yaml.dump(output_data, default_flow_style=False, sort_keys=False)
+        output = serialize_to_yaml(output_data)
 
     # Write output
     if args.output:
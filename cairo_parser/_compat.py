@@ -0,0 +1,10 @@
+"""
+Python Version Compatibility
+
+Small shims for features that are not available on every supported Python.
+"""
+
+import sys
+
+# @dataclass(**DATACLASS_SLOTS) adds __slots__ where supported (Python 3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -17,6 +17,7 @@ from cairo_parser.analysis.statements import (
     StorageWriteStmt,
     AssertStmt,
     StatementParser,
+    StatementBatch,
 )
 
 from cairo_parser.analysis.cfg import (
@@ -51,6 +52,7 @@ __all__ = [
     'StorageWriteStmt',
     'AssertStmt',
     'StatementParser',
+    'StatementBatch',
 
     # CFG
     'CFGNode',
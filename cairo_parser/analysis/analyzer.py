@@ -20,7 +20,7 @@ class FunctionAnalysisResult:
     function_name: str
     has_body: bool
     cfg: Optional[Dict[str, Any]] = None
-    dataflow: Optional[Dict[str, Any]] = None
+    dataflow: Optional[Dict[str, List[Any]]] = None  # DataflowAnalyzer.analyze_all() objects
     warnings: List[Dict[str, Any]] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
 
@@ -35,7 +35,7 @@ class FunctionAnalysisResult:
             result['cfg'] = self.cfg
 
         if self.dataflow:
-            result['dataflow'] = self.dataflow
+            result['dataflow'] = DataflowAnalyzer.serialize(self.dataflow)
 
         if self.warnings:
             result['warnings'] = self.warnings
@@ -209,11 +209,11 @@ class CairoAnalyzer:
                     storage_accesses = func.dataflow.get('storage_accesses', [])
                     total_storage_reads += sum(
                         1 for sa in storage_accesses
-                        if sa.get('access_type') == 'read'
+                        if sa.access_type == 'read'
                     )
                     total_storage_writes += sum(
                         1 for sa in storage_accesses
-                        if sa.get('access_type') == 'write'
+                        if sa.access_type == 'write'
                     )
 
                     external_calls = func.dataflow.get('external_calls', [])
@@ -4,10 +4,14 @@ Control Flow Graph (CFG) Builder for Cairo Functions
 Constructs control flow graphs from parsed statements for analysis.
 """
 
-from typing import List, Dict, Set, Optional, Any
+from array import array
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Set, Tuple, Sequence, Iterator, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
+from cairo_parser._compat import DATACLASS_SLOTS
 from cairo_parser.analysis.statements import (
     Statement,
     StatementType,
@@ -28,7 +32,7 @@ class CFGNodeType(Enum):
     LOOP_HEADER = "loop_header"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CFGNode:
     """
     A node in the Control Flow Graph.
@@ -39,16 +43,17 @@ class CFGNode:
     id: int
     node_type: CFGNodeType
     statement: Optional[Statement] = None
-    successors: List[int] = field(default_factory=list)
-    predecessors: List[int] = field(default_factory=list)
+    # Lists while the graph is being built, frozen to tuples by finalize()
+    successors: Sequence[int] = field(default_factory=list)
+    predecessors: Sequence[int] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert CFG node to dictionary for serialization."""
         result = {
             'id': self.id,
             'type': self.node_type.value,
-            'successors': self.successors,
-            'predecessors': self.predecessors,
+            'successors': list(self.successors),
+            'predecessors': list(self.predecessors),
         }
 
         if self.statement:
@@ -70,23 +75,73 @@ class ControlFlowGraph:
     entry_node_id: Optional[int] = None
     exit_node_ids: List[int] = field(default_factory=list)
 
+    # ID -> node index so lookups don't scan the node list
+    _node_index: Dict[int, CFGNode] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # (from_id, to_id) pairs already added, for O(1) edge deduplication
+    _edges: Set[Tuple[int, int]] = field(default_factory=set, init=False, repr=False, compare=False)
+    # Cached CSR arrays, dropped whenever an edge is added
+    _csr: Optional[Tuple[array, array, array, array]] = field(default=None, init=False, repr=False, compare=False)
+
+    def add_node(self, node: CFGNode):
+        """Append a node and register it in the ID index."""
+        self.nodes.append(node)
+        self._node_index[node.id] = node
+
     def get_node(self, node_id: int) -> Optional[CFGNode]:
         """Get node by ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        node = self._node_index.get(node_id)
+        if node is None and len(self._node_index) != len(self.nodes):
+            # Nodes were appended directly to the list; rebuild the index
+            self._node_index = {n.id: n for n in self.nodes}
+            node = self._node_index.get(node_id)
+        return node
 
     def add_edge(self, from_id: int, to_id: int):
         """Add an edge between two nodes."""
         from_node = self.get_node(from_id)
         to_node = self.get_node(to_id)
 
-        if from_node and to_node:
-            if to_id not in from_node.successors:
-                from_node.successors.append(to_id)
-            if from_id not in to_node.predecessors:
-                to_node.predecessors.append(from_id)
+        if from_node and to_node and (from_id, to_id) not in self._edges:
+            self._edges.add((from_id, to_id))
+            self._csr = None
+            # += works on both the building lists and finalized tuples
+            from_node.successors += (to_id,)
+            to_node.predecessors += (from_id,)
+
+    def finalize(self):
+        """Freeze adjacency lists into tuples once construction is done."""
+        for node in self.nodes:
+            node.successors = tuple(node.successors)
+            node.predecessors = tuple(node.predecessors)
+
+    def to_csr(self) -> Tuple[array, array, array, array]:
+        """
+        Get the graph in compressed sparse row form.
+
+        The successors of node n are succ_idx[succ_off[n]:succ_off[n + 1]],
+        and likewise for predecessors. Offsets are indexed by node ID.
+
+        Returns:
+            (succ_off, succ_idx, pred_off, pred_idx) as flat int arrays
+        """
+        if self._csr is None:
+            size = max((node.id for node in self.nodes), default=-1) + 1
+            by_id: List[Optional[CFGNode]] = [None] * size
+            for node in self.nodes:
+                by_id[node.id] = node
+
+            succ_off, succ_idx = array('i', [0]), array('i')
+            pred_off, pred_idx = array('i', [0]), array('i')
+            for node in by_id:
+                if node is not None:
+                    succ_idx.extend(node.successors)
+                    pred_idx.extend(node.predecessors)
+                succ_off.append(len(succ_idx))
+                pred_off.append(len(pred_idx))
+
+            self._csr = (succ_off, succ_idx, pred_off, pred_idx)
+
+        return self._csr
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert CFG to dictionary for serialization."""
@@ -110,6 +165,16 @@ class CFGBuilder:
         self.node_counter = 0
         self.cfg: Optional[ControlFlowGraph] = None
 
+        # block_end[i]: index of the first statement after i at depth <= its own
+        self._block_end: List[int] = []
+
+        # Control flow statement handlers, keyed by exact statement type
+        self._dispatch = {
+            IfStmt: self._build_if,
+            MatchStmt: self._build_match,
+            ReturnStmt: self._build_return,
+        }
+
     def build(self, function_name: str, statements: List[Statement]) -> ControlFlowGraph:
         """
         Build a CFG from a list of statements.
@@ -135,9 +200,11 @@ class CFGBuilder:
         if not statements:
             # Empty function: entry -> exit
             self.cfg.add_edge(entry_node.id, exit_node.id)
+            self.cfg.finalize()
             return self.cfg
 
         # Build CFG from statements
+        self._block_end = self._compute_block_ends(statements)
         current_node_id = entry_node.id
         current_node_id = self._build_sequential(statements, current_node_id, exit_node.id)
 
@@ -145,6 +212,7 @@ class CFGBuilder:
         if current_node_id is not None:
             self.cfg.add_edge(current_node_id, exit_node.id)
 
+        self.cfg.finalize()
         return self.cfg
 
     def _create_node(self, node_type: CFGNodeType, statement: Optional[Statement] = None) -> CFGNode:
@@ -155,44 +223,68 @@ class CFGBuilder:
             statement=statement
         )
         self.node_counter += 1
-        self.cfg.nodes.append(node)
+        self.cfg.add_node(node)
         return node
 
+    @staticmethod
+    def _compute_block_ends(statements: List[Statement]) -> List[int]:
+        """
+        Find where each statement's block ends, in a single backward scan.
+
+        Args:
+            statements: Full statement list
+
+        Returns:
+            For each index i, the first index j > i whose block depth is
+            <= that of statement i, or len(statements) if there is none
+        """
+        block_end = [len(statements)] * len(statements)
+        # Indices after i with non-decreasing depth from the top down
+        stack: List[int] = []
+        for i in range(len(statements) - 1, -1, -1):
+            depth = statements[i].block_depth
+            while stack and statements[stack[-1]].block_depth > depth:
+                stack.pop()
+            if stack:
+                block_end[i] = stack[-1]
+            stack.append(i)
+        return block_end
+
     def _build_sequential(
         self,
         statements: List[Statement],
         current_id: int,
         exit_id: int,
-        start_idx: int = 0
+        start_idx: int = 0,
+        end_idx: Optional[int] = None
     ) -> Optional[int]:
         """
         Build CFG for sequential statements.
 
         Args:
-            statements: List of statements to process
+            statements: Full statement list passed to build()
             current_id: Current node ID to connect from
             exit_id: Exit node ID for returns
             start_idx: Starting index in statements list
+            end_idx: Index to stop before (defaults to the end of the list)
 
         Returns:
             ID of the last node in the sequence, or None if terminated
         """
+        if end_idx is None:
+            end_idx = len(statements)
+
         i = start_idx
-        while i < len(statements):
+        while i < end_idx:
             stmt = statements[i]
 
             # Handle control flow statements
-            if isinstance(stmt, IfStmt):
-                current_id, i = self._build_if(statements, i, current_id, exit_id)
-            elif isinstance(stmt, MatchStmt):
-                current_id, i = self._build_match(statements, i, current_id, exit_id)
-            elif isinstance(stmt, ReturnStmt):
-                # Create return node
-                return_node = self._create_node(CFGNodeType.STATEMENT, stmt)
-                self.cfg.add_edge(current_id, return_node.id)
-                self.cfg.add_edge(return_node.id, exit_id)
-                # Return statement terminates this path
-                return None
+            handler = self._dispatch.get(type(stmt))
+            if handler:
+                current_id, i = handler(statements, i, end_idx, current_id, exit_id)
+                if current_id is None:
+                    # Path terminated (return)
+                    return None
             else:
                 # Regular statement
                 stmt_node = self._create_node(CFGNodeType.STATEMENT, stmt)
@@ -203,10 +295,30 @@ class CFGBuilder:
 
         return current_id
 
+    def _build_return(
+        self,
+        statements: List[Statement],
+        return_idx: int,
+        end_idx: int,
+        current_id: int,
+        exit_id: int
+    ) -> tuple[Optional[int], int]:
+        """
+        Build CFG for return statement.
+
+        Returns:
+            (None, return_idx) since a return terminates the current path
+        """
+        return_node = self._create_node(CFGNodeType.STATEMENT, statements[return_idx])
+        self.cfg.add_edge(current_id, return_node.id)
+        self.cfg.add_edge(return_node.id, exit_id)
+        return None, return_idx
+
     def _build_if(
         self,
         statements: List[Statement],
         if_idx: int,
+        end_idx: int,
         current_id: int,
         exit_id: int
     ) -> tuple[Optional[int], int]:
@@ -216,6 +328,7 @@ class CFGBuilder:
         Args:
             statements: Full statement list
             if_idx: Index of if statement
+            end_idx: End of the enclosing sequence
             current_id: Current node ID
             exit_id: Exit node ID
 
@@ -223,21 +336,20 @@ class CFGBuilder:
             (merge_node_id, next_statement_index)
         """
         if_stmt = statements[if_idx]
-        if_depth = if_stmt.block_depth
 
         # Create branch node for the condition
         branch_node = self._create_node(CFGNodeType.BRANCH, if_stmt)
         self.cfg.add_edge(current_id, branch_node.id)
 
-        # Extract the then-block and else-block
-        then_block, else_block, next_idx = self._extract_if_blocks(statements, if_idx)
+        # Locate the then-block and else-block
+        then_end, else_idx, next_idx = self._extract_if_blocks(statements, if_idx, end_idx)
 
         # Create merge node (where both branches converge)
         merge_node = self._create_node(CFGNodeType.MERGE)
 
         # Build then-branch
-        if then_block:
-            then_last = self._build_sequential(then_block, branch_node.id, exit_id)
+        if then_end > if_idx + 1:
+            then_last = self._build_sequential(statements, branch_node.id, exit_id, if_idx + 1, then_end)
             if then_last is not None:
                 self.cfg.add_edge(then_last, merge_node.id)
         else:
@@ -245,8 +357,8 @@ class CFGBuilder:
             self.cfg.add_edge(branch_node.id, merge_node.id)
 
         # Build else-branch (if exists)
-        if else_block:
-            else_last = self._build_sequential(else_block, branch_node.id, exit_id)
+        if else_idx is not None and next_idx > else_idx + 1:
+            else_last = self._build_sequential(statements, branch_node.id, exit_id, else_idx + 1, next_idx)
             if else_last is not None:
                 self.cfg.add_edge(else_last, merge_node.id)
         else:
@@ -260,6 +372,7 @@ class CFGBuilder:
         self,
         statements: List[Statement],
         match_idx: int,
+        end_idx: int,
         current_id: int,
         exit_id: int
     ) -> tuple[Optional[int], int]:
@@ -269,6 +382,7 @@ class CFGBuilder:
         Args:
             statements: Full statement list
             match_idx: Index of match statement
+            end_idx: End of the enclosing sequence
             current_id: Current node ID
             exit_id: Exit node ID
 
@@ -276,7 +390,6 @@ class CFGBuilder:
             (merge_node_id, next_statement_index)
         """
         match_stmt = statements[match_idx]
-        match_depth = match_stmt.block_depth
 
         # Create branch node for match
         branch_node = self._create_node(CFGNodeType.BRANCH, match_stmt)
@@ -285,22 +398,13 @@ class CFGBuilder:
         # Create merge node
         merge_node = self._create_node(CFGNodeType.MERGE)
 
-        # Find the end of the match block (when we return to the match's depth level)
-        next_idx = match_idx + 1
-        for i in range(match_idx + 1, len(statements)):
-            if statements[i].block_depth <= match_depth:
-                next_idx = i
-                break
-        else:
-            next_idx = len(statements)
+        # The match block ends when we return to the match's depth level
+        next_idx = min(self._block_end[match_idx], end_idx)
 
-        # Extract match body statements
-        match_body = statements[match_idx + 1:next_idx]
-
-        if match_body:
+        if next_idx > match_idx + 1:
             # Simplified: treat match body as sequential for now
             # A full implementation would parse individual arms
-            body_last = self._build_sequential(match_body, branch_node.id, exit_id)
+            body_last = self._build_sequential(statements, branch_node.id, exit_id, match_idx + 1, next_idx)
             if body_last is not None:
                 self.cfg.add_edge(body_last, merge_node.id)
         else:
@@ -311,60 +415,56 @@ class CFGBuilder:
     def _extract_if_blocks(
         self,
         statements: List[Statement],
-        if_idx: int
-    ) -> tuple[List[Statement], Optional[List[Statement]], int]:
+        if_idx: int,
+        end_idx: int
+    ) -> tuple[int, Optional[int], int]:
         """
-        Extract then-block and else-block from if statement using block depths.
+        Locate then-block and else-block of an if statement using block depths.
+
+        The then-block is statements[if_idx + 1:then_end]; when an else at the
+        if's depth follows it, the else-block is statements[else_idx + 1:next_index].
 
         Returns:
-            (then_statements, else_statements, next_index)
+            (then_end, else_idx or None, next_index)
         """
-        if_stmt = statements[if_idx]
-        if_depth = if_stmt.block_depth
-
-        then_block = []
-        else_block = None
-        else_idx = None
+        if_depth = statements[if_idx].block_depth
 
-        # Look for statements inside the if block
-        i = if_idx + 1
-        while i < len(statements):
-            stmt = statements[i]
+        # The then-block ends at the first statement back at the if's depth or less
+        then_end = min(self._block_end[if_idx], end_idx)
 
-            # Check if we've found an else at the same depth as the if
+        if then_end < end_idx:
+            stmt = statements[then_end]
             if isinstance(stmt, ElseStmt) and stmt.block_depth == if_depth:
-                else_idx = i
-                break
+                return then_end, then_end, min(self._block_end[then_end], end_idx)
 
-            # Check if we've exited the if block (back to if's depth or less)
-            if stmt.block_depth <= if_depth:
-                break
+        return then_end, None, then_end
 
-            # This statement is inside the then-block
-            then_block.append(stmt)
-            i += 1
+    def _trivial_exit_id(self) -> Optional[int]:
+        """
+        Check for the CFG of a function without statements.
 
-        # If we found an else, extract the else block
-        if else_idx is not None:
-            else_block = []
-            i = else_idx + 1
-            while i < len(statements):
-                stmt = statements[i]
+        Returns:
+            The exit node ID if the graph is exactly entry -> exit, else None
+        """
+        if len(self.cfg.nodes) != 2 or self.cfg.entry_node_id in self.cfg.exit_node_ids:
+            return None
 
-                # Check if we've exited the else block
-                if stmt.block_depth <= if_depth:
-                    break
+        entry = self.cfg.get_node(self.cfg.entry_node_id)
+        if entry is None or entry.predecessors or len(entry.successors) != 1:
+            return None
 
-                else_block.append(stmt)
-                i += 1
+        exit_node = self.cfg.get_node(entry.successors[0])
+        if exit_node.successors or exit_node.id not in self.cfg.exit_node_ids:
+            return None
 
-        return then_block, else_block, i
+        return exit_node.id
 
     def compute_dominators(self) -> Dict[int, Set[int]]:
         """
         Compute dominator sets for each node.
 
         A node d dominates node n if every path from entry to n goes through d.
+        Sets are derived from the immediate dominator tree.
 
         Returns:
             Dictionary mapping node IDs to sets of dominator node IDs
@@ -372,37 +472,165 @@ class CFGBuilder:
         if not self.cfg or self.cfg.entry_node_id is None:
             return {}
 
-        # Initialize: entry dominates only itself, all others dominated by all nodes
-        all_nodes = {node.id for node in self.cfg.nodes}
-        dominators = {
-            self.cfg.entry_node_id: {self.cfg.entry_node_id}
-        }
+        trivial = self._trivial_exit_id()
+        if trivial is not None:
+            entry_id = self.cfg.entry_node_id
+            return {
+                node.id: {entry_id} if node.id == entry_id else {entry_id, trivial}
+                for node in self.cfg.nodes
+            }
 
+        idom = self.compute_immediate_dominators()
+
+        # dom(n) = {n} ∪ dom(idom(n)), filled in by walking up the idom chain
+        dominators: Dict[int, Set[int]] = {}
         for node in self.cfg.nodes:
-            if node.id != self.cfg.entry_node_id:
-                dominators[node.id] = all_nodes.copy()
-
-        # Iteratively compute dominators
-        changed = True
-        while changed:
-            changed = False
-            for node in self.cfg.nodes:
-                if node.id == self.cfg.entry_node_id:
+            chain = []
+            current = node.id
+            while current is not None and current not in dominators:
+                chain.append(current)
+                current = idom[current]
+
+            dom = dominators[current] if current is not None else set()
+            for node_id in reversed(chain):
+                dom = dom | {node_id}
+                dominators[node_id] = dom
+
+        return {node.id: dominators[node.id] for node in self.cfg.nodes}
+
+    def compute_immediate_dominators(self) -> Dict[int, Optional[int]]:
+        """
+        Compute the immediate dominator of each node.
+
+        Uses the Cooper-Harvey-Kennedy iterative algorithm over reverse
+        postorder. The entry node and any other node without predecessors
+        (code left unreachable by a return) are roots of the tree.
+
+        Returns:
+            Dictionary mapping node IDs to their immediate dominator ID,
+            or None for roots
+        """
+        if not self.cfg or self.cfg.entry_node_id is None:
+            return {}
+
+        trivial = self._trivial_exit_id()
+        if trivial is not None:
+            entry_id = self.cfg.entry_node_id
+            return {node.id: None if node.id == entry_id else entry_id for node in self.cfg.nodes}
+
+        succ_off, succ_idx, pred_off, pred_idx = self.cfg.to_csr()
+        order, roots = self._reverse_postorder()
+
+        # Roots hang off a virtual node that precedes everything in RPO
+        virtual_root = -1
+        position = {node_id: i for i, node_id in enumerate(order)}
+        position[virtual_root] = -1
+        idom = {root: virtual_root for root in roots}
+
+        # The tree's child lists, kept in step with idom (dicts as ordered sets)
+        children: Dict[int, Dict[int, None]] = {virtual_root: dict.fromkeys(roots)}
+
+        def intersect(b1: int, b2: int) -> int:
+            # Walk the later node (in RPO) up the tree until the fingers meet
+            while b1 != b2:
+                while position[b1] > position[b2]:
+                    b1 = idom[b1]
+                while position[b2] > position[b1]:
+                    b2 = idom[b2]
+            return b1
+
+        # Worklist seeded in RPO; a node is revisited only when the
+        # dominators of one of its predecessors change
+        worklist = deque(node_id for node_id in order if idom.get(node_id) != virtual_root)
+        queued = set(worklist)
+
+        while worklist:
+            node_id = worklist.popleft()
+            queued.discard(node_id)
+
+            new_idom = None
+            for pred_id in pred_idx[pred_off[node_id]:pred_off[node_id + 1]]:
+                if pred_id not in idom:
                     continue
+                new_idom = pred_id if new_idom is None else intersect(pred_id, new_idom)
+
+            if new_idom is None or idom.get(node_id) == new_idom:
+                continue
+
+            # A changed idom changes the dominator set of every node below it
+            # in the tree, so all of their successors need another look
+            changed = [node_id]
+            if node_id in idom:
+                changed = self._dominator_subtree(children, node_id)
+                del children[idom[node_id]][node_id]
+            idom[node_id] = new_idom
+            children.setdefault(new_idom, {})[node_id] = None
+
+            for changed_id in changed:
+                for succ_id in succ_idx[succ_off[changed_id]:succ_off[changed_id + 1]]:
+                    if succ_id not in queued and idom.get(succ_id) != virtual_root:
+                        queued.add(succ_id)
+                        worklist.append(succ_id)
 
-                # New dominators = {node} ∪ (intersection of predecessors' dominators)
-                new_dom = {node.id}
+        return {
+            node.id: (None if idom[node.id] == virtual_root else idom[node.id])
+            for node in self.cfg.nodes
+        }
 
-                if node.predecessors:
-                    pred_doms = [dominators[pred_id] for pred_id in node.predecessors]
-                    if pred_doms:
-                        new_dom = new_dom.union(set.intersection(*pred_doms))
+    @staticmethod
+    def _dominator_subtree(children: Dict[int, Dict[int, None]], root_id: int) -> List[int]:
+        """Get root_id and every node below it in the dominator tree."""
+        subtree = [root_id]
+        for node_id in subtree:
+            subtree.extend(children.get(node_id, ()))
+        return subtree
 
-                if new_dom != dominators[node.id]:
-                    dominators[node.id] = new_dom
-                    changed = True
+    def _reverse_postorder(self) -> tuple[List[int], List[int]]:
+        """
+        Order nodes by reverse postorder of a DFS over successors.
 
-        return dominators
+        The DFS starts from the entry node, then from each other node without
+        predecessors, then from any node still unvisited, so every node is
+        ordered exactly once.
+
+        Returns:
+            (node IDs in reverse postorder, DFS start nodes)
+        """
+        succ_off, succ_idx, pred_off, _ = self.cfg.to_csr()
+        entry_id = self.cfg.entry_node_id
+        node_ids = [node.id for node in self.cfg.nodes]
+
+        candidates = [entry_id]
+        candidates.extend(
+            node_id for node_id in node_ids
+            if node_id != entry_id and pred_off[node_id] == pred_off[node_id + 1]
+        )
+        candidates.extend(node_ids)
+
+        visited: Set[int] = set()
+        postorder: List[int] = []
+        roots: List[int] = []
+
+        for root in candidates:
+            if root in visited:
+                continue
+            roots.append(root)
+            visited.add(root)
+            stack = [(root, iter(succ_idx[succ_off[root]:succ_off[root + 1]]))]
+
+            while stack:
+                node_id, succs = stack[-1]
+                for succ_id in succs:
+                    if succ_id not in visited:
+                        visited.add(succ_id)
+                        stack.append((succ_id, iter(succ_idx[succ_off[succ_id]:succ_off[succ_id + 1]])))
+                        break
+                else:
+                    stack.pop()
+                    postorder.append(node_id)
+
+        postorder.reverse()
+        return postorder, roots
 
     def find_all_paths(self, max_paths: int = 100) -> List[List[int]]:
         """
@@ -417,43 +645,45 @@ class CFGBuilder:
         if not self.cfg or self.cfg.entry_node_id is None:
             return []
 
-        paths = []
-        self._dfs_paths(
-            current_id=self.cfg.entry_node_id,
-            current_path=[],
-            visited=set(),
-            paths=paths,
-            max_paths=max_paths
-        )
+        trivial = self._trivial_exit_id()
+        if trivial is not None:
+            return [[self.cfg.entry_node_id, trivial]] if max_paths > 0 else []
 
-        return paths
+        return [list(path) for path in islice(self._dfs_paths(), max(max_paths, 0))]
 
-    def _dfs_paths(
-        self,
-        current_id: int,
-        current_path: List[int],
-        visited: Set[int],
-        paths: List[List[int]],
-        max_paths: int
-    ):
-        """DFS helper for path enumeration."""
-        if len(paths) >= max_paths:
-            return
+    def _dfs_paths(self) -> Iterator[Tuple[int, ...]]:
+        """
+        Iterative DFS helper for path enumeration.
 
-        # Add current node to path
-        current_path = current_path + [current_id]
-        visited = visited.copy()
-        visited.add(current_id)
+        Keeps a single path list and visited bitmap, updated on push and
+        pop, and yields each simple path that reaches an exit node.
+        """
+        succ_off, succ_idx, _, _ = self.cfg.to_csr()
+        exit_ids = set(self.cfg.exit_node_ids)
+        entry_id = self.cfg.entry_node_id
 
-        # Check if reached exit
-        if current_id in self.cfg.exit_node_ids:
-            paths.append(current_path)
+        path = [entry_id]
+        if entry_id in exit_ids:
+            yield tuple(path)
             return
 
-        # Explore successors
-        current_node = self.cfg.get_node(current_id)
-        if current_node:
-            for succ_id in current_node.successors:
+        visited = bytearray(len(succ_off) - 1)
+        visited[entry_id] = 1
+        stack = [iter(succ_idx[succ_off[entry_id]:succ_off[entry_id + 1]])]
+
+        while stack:
+            for succ_id in stack[-1]:
                 # Avoid infinite loops
-                if succ_id not in visited:
-                    self._dfs_paths(succ_id, current_path, visited, paths, max_paths)
+                if visited[succ_id]:
+                    continue
+                if succ_id in exit_ids:
+                    yield tuple(path) + (succ_id,)
+                    continue
+
+                path.append(succ_id)
+                visited[succ_id] = 1
+                stack.append(iter(succ_idx[succ_off[succ_id]:succ_off[succ_id + 1]]))
+                break
+            else:
+                stack.pop()
+                visited[path.pop()] = 0
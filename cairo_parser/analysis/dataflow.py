@@ -7,9 +7,12 @@ Performs dataflow analysis including:
 - External call identification
 """
 
-from typing import List, Dict, Set, Optional, Any
+import sys
+from collections import deque
+from typing import List, Dict, Set, Tuple, Optional, Any
 from dataclasses import dataclass, field
 
+from cairo_parser._compat import DATACLASS_SLOTS
 from cairo_parser.analysis.cfg import ControlFlowGraph, CFGNode
 from cairo_parser.analysis.statements import (
     Statement,
@@ -22,7 +25,7 @@ from cairo_parser.analysis.statements import (
 )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DefUseChain:
     """
     Definition-Use chain for a variable.
@@ -42,7 +45,7 @@ class DefUseChain:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StorageAccess:
     """
     Storage variable access (read or write).
@@ -68,7 +71,7 @@ class StorageAccess:
         return result
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExternalCall:
     """
     External function call.
@@ -106,15 +109,57 @@ class DataflowAnalyzer:
         Args:
             cfg: Control flow graph to analyze
         """
-        self.cfg = cfg
         self.statement_parser = StatementParser()
+        self.cfg = cfg
+
+    @property
+    def cfg(self) -> ControlFlowGraph:
+        """Control flow graph under analysis."""
+        return self._cfg
+
+    @cfg.setter
+    def cfg(self, cfg: ControlFlowGraph):
+        """Set the graph to analyze, dropping results cached for the old one."""
+        self._cfg = cfg
+        self._chain_cache: Optional[List[DefUseChain]] = None
+        self._reaching_cache: Optional[Dict[int, Set[tuple[str, int]]]] = None
+
+        # Flat adjacency arrays shared by the fixed-point loops
+        self._succ_off, self._succ_idx, self._pred_off, self._pred_idx = cfg.to_csr()
+
+        # Statement-bearing nodes, bucketed once by what each analysis needs.
+        # Storage reads and writes share a list to keep them in node order.
+        self._stmt_nodes: List[CFGNode] = []
+        self._storage_nodes: List[CFGNode] = []
+        self._call_nodes: List[CFGNode] = []
+
+        # Variables defined/used per node, extracted once. Tuples keep source
+        # order and repeated uses, which the chains and warnings report.
+        self._defs: Dict[int, Tuple[str, ...]] = {}
+        self._uses: Dict[int, Tuple[str, ...]] = {}
+
+        for node in cfg.nodes:
+            stmt = node.statement
+            if stmt is None:
+                continue
+
+            self._stmt_nodes.append(node)
+            if isinstance(stmt, (StorageReadStmt, StorageWriteStmt)):
+                self._storage_nodes.append(node)
+            elif isinstance(stmt, CallStmt):
+                self._call_nodes.append(node)
 
-    def analyze_all(self) -> Dict[str, Any]:
+            # Interned so set/dict operations on names hit the identity fast path
+            self._defs[node.id] = tuple(map(sys.intern, self.statement_parser.extract_variables_defined(stmt)))
+            self._uses[node.id] = tuple(map(sys.intern, self.statement_parser.extract_variables_used(stmt)))
+
+    def analyze_all(self) -> Dict[str, List[Any]]:
         """
         Perform all dataflow analyses.
 
         Returns:
-            Dictionary containing all analysis results
+            Dictionary containing all analysis results as result objects;
+            use serialize() to convert them to dicts
         """
         return {
             'def_use_chains': self.analyze_def_use_chains(),
@@ -122,60 +167,88 @@ class DataflowAnalyzer:
             'external_calls': self.analyze_external_calls(),
         }
 
-    def analyze_def_use_chains(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def serialize(results: Dict[str, List[Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Convert analyze_all() results to dictionaries for serialization.
+
+        Args:
+            results: Dictionary returned by analyze_all()
+
+        Returns:
+            Same structure with every result object replaced by its to_dict()
+        """
+        return {
+            kind: [item.to_dict() for item in items]
+            for kind, items in results.items()
+        }
+
+    def analyze_def_use_chains(self) -> List[DefUseChain]:
         """
         Analyze variable definitions and uses.
 
         Returns:
-            List of DefUseChain objects serialized as dicts
+            List of DefUseChain objects, ordered by first definition
+            (variables that are only used come last); the caller owns them
         """
+        return [
+            DefUseChain(
+                variable=chain.variable,
+                definitions=list(chain.definitions),
+                uses=list(chain.uses)
+            )
+            for chain in self._def_use_chains()
+        ]
+
+    def _def_use_chains(self) -> List[DefUseChain]:
+        """Def-use chains, computed once per graph; shared, so never modified."""
+        if self._chain_cache is not None:
+            return self._chain_cache
+
         # Track definitions and uses per variable
         var_defs: Dict[str, List[int]] = {}
         var_uses: Dict[str, List[int]] = {}
 
-        for node in self.cfg.nodes:
-            if node.statement:
-                # Extract defined variables
-                defined_vars = self.statement_parser.extract_variables_defined(node.statement)
-                for var in defined_vars:
-                    if var not in var_defs:
-                        var_defs[var] = []
-                    var_defs[var].append(node.id)
-
-                # Extract used variables
-                used_vars = self.statement_parser.extract_variables_used(node.statement)
-                for var in used_vars:
-                    if var not in var_uses:
-                        var_uses[var] = []
-                    var_uses[var].append(node.id)
-
-        # Build def-use chains
-        all_vars = set(var_defs.keys()) | set(var_uses.keys())
+        for node in self._stmt_nodes:
+            # Extract defined variables
+            defined_vars = self._defs[node.id]
+            for var in defined_vars:
+                if var not in var_defs:
+                    var_defs[var] = []
+                var_defs[var].append(node.id)
+
+            # Extract used variables
+            used_vars = self._uses[node.id]
+            for var in used_vars:
+                if var not in var_uses:
+                    var_uses[var] = []
+                var_uses[var].append(node.id)
+
+        # Build def-use chains in first-seen order (defined variables first,
+        # then ones that are only used); callers can sort if they need to
         chains = []
 
-        for var in sorted(all_vars):
+        for var in dict.fromkeys([*var_defs, *var_uses]):
             chain = DefUseChain(
                 variable=var,
                 definitions=var_defs.get(var, []),
                 uses=var_uses.get(var, [])
             )
-            chains.append(chain.to_dict())
+            chains.append(chain)
 
+        self._chain_cache = chains
         return chains
 
-    def analyze_storage_access(self) -> List[Dict[str, Any]]:
+    def analyze_storage_access(self) -> List[StorageAccess]:
         """
         Analyze storage variable accesses.
 
         Returns:
-            List of StorageAccess objects serialized as dicts
+            List of StorageAccess objects
         """
         accesses = []
 
-        for node in self.cfg.nodes:
-            if not node.statement:
-                continue
-
+        for node in self._storage_nodes:
             stmt = node.statement
 
             if isinstance(stmt, StorageReadStmt):
@@ -185,7 +258,7 @@ class DataflowAnalyzer:
                     node_id=node.id,
                     line=stmt.line
                 )
-                accesses.append(access.to_dict())
+                accesses.append(access)
 
             elif isinstance(stmt, StorageWriteStmt):
                 access = StorageAccess(
@@ -195,34 +268,29 @@ class DataflowAnalyzer:
                     line=stmt.line,
                     value=stmt.value
                 )
-                accesses.append(access.to_dict())
+                accesses.append(access)
 
         return accesses
 
-    def analyze_external_calls(self) -> List[Dict[str, Any]]:
+    def analyze_external_calls(self) -> List[ExternalCall]:
         """
         Identify external function calls.
 
         Returns:
-            List of ExternalCall objects serialized as dicts
+            List of ExternalCall objects
         """
         calls = []
 
-        for node in self.cfg.nodes:
-            if not node.statement:
-                continue
-
+        for node in self._call_nodes:
             stmt = node.statement
-
-            if isinstance(stmt, CallStmt):
-                call = ExternalCall(
-                    function_name=stmt.function_name,
-                    arguments=stmt.arguments,
-                    node_id=node.id,
-                    line=stmt.line,
-                    is_external=stmt.is_external
-                )
-                calls.append(call.to_dict())
+            call = ExternalCall(
+                function_name=stmt.function_name,
+                arguments=stmt.arguments,
+                node_id=node.id,
+                line=stmt.line,
+                is_external=stmt.is_external
+            )
+            calls.append(call)
 
         return calls
 
@@ -234,46 +302,101 @@ class DataflowAnalyzer:
         along which d is not killed (overwritten).
 
         Returns:
-            Dictionary mapping node IDs to sets of (variable, def_node_id) pairs
+            Dictionary mapping node IDs to sets of (variable, def_node_id)
+            pairs; the caller owns the dict and its sets
         """
-        # Initialize reaching definitions
-        reaching_in: Dict[int, Set[tuple[str, int]]] = {}
-        reaching_out: Dict[int, Set[tuple[str, int]]] = {}
-
-        for node in self.cfg.nodes:
-            reaching_in[node.id] = set()
-            reaching_out[node.id] = set()
-
-        # Iterative dataflow analysis (forward)
-        changed = True
-        iterations = 0
-        max_iterations = 100
-
-        while changed and iterations < max_iterations:
-            changed = False
-            iterations += 1
-
-            for node in self.cfg.nodes:
-                # Reaching_in[n] = Union of Reaching_out[p] for all predecessors p
-                new_in = set()
-                for pred_id in node.predecessors:
-                    new_in = new_in.union(reaching_out.get(pred_id, set()))
-
-                if new_in != reaching_in[node.id]:
-                    reaching_in[node.id] = new_in
-                    changed = True
+        return {
+            node_id: set(pairs)
+            for node_id, pairs in self._reaching_definitions().items()
+        }
 
-                # Reaching_out[n] = Gen[n] ∪ (Reaching_in[n] - Kill[n])
-                gen_set = self._gen_definitions(node)
-                kill_set = self._kill_definitions(node, reaching_in[node.id])
+    def _reaching_definitions(self) -> Dict[int, Set[tuple[str, int]]]:
+        """Reaching definitions, computed once per graph; shared, so never modified."""
+        if self._reaching_cache is not None:
+            return self._reaching_cache
+
+        # Nothing is defined anywhere, so nothing reaches anywhere
+        if not any(self._defs.values()):
+            self._reaching_cache = {node.id: set() for node in self.cfg.nodes}
+            return self._reaching_cache
+
+        # Give every (variable, def_node_id) pair a bit so that reaching
+        # sets become ints and set algebra becomes bitwise ops
+        all_defs: List[tuple[str, int]] = []
+        gen_bits: Dict[int, int] = dict.fromkeys((node.id for node in self.cfg.nodes), 0)
+        kill_bits: Dict[int, int] = dict(gen_bits)
+
+        # Bits of every definition of each variable, anywhere in the function
+        defs_of_var: Dict[str, int] = {}
+
+        # GEN sets are accumulated in place while numbering the pairs
+        for node in self._stmt_nodes:
+            bits = 0
+            for pair in self._gen_definitions(node):
+                bit = 1 << len(all_defs)
+                all_defs.append(pair)
+                bits |= bit
+                defs_of_var[pair[0]] = defs_of_var.get(pair[0], 0) | bit
+            gen_bits[node.id] = bits
+
+        # A node kills the other definitions of the variables it defines
+        for node in self._stmt_nodes:
+            bits = 0
+            for var in self._defs[node.id]:
+                bits |= defs_of_var[var]
+            kill_bits[node.id] = bits & ~gen_bits[node.id]
 
-                new_out = gen_set.union(reaching_in[node.id] - kill_set)
+        # Initialize reaching definitions
+        reaching_in: Dict[int, int] = {node.id: 0 for node in self.cfg.nodes}
+        reaching_out: Dict[int, int] = {node.id: 0 for node in self.cfg.nodes}
 
-                if new_out != reaching_out[node.id]:
-                    reaching_out[node.id] = new_out
-                    changed = True
+        succ_off, succ_idx = self._succ_off, self._succ_idx
+        pred_off, pred_idx = self._pred_off, self._pred_idx
 
-        return reaching_in
+        # Worklist dataflow analysis (forward): a node is revisited only
+        # when the reaching-out set of one of its predecessors changes
+        worklist = deque(node.id for node in self.cfg.nodes)
+        queued = set(worklist)
+        max_iterations = 100
+        max_visits = max_iterations * len(self.cfg.nodes)
+        visits = 0
+
+        while worklist and visits < max_visits:
+            node_id = worklist.popleft()
+            queued.discard(node_id)
+            visits += 1
+
+            # Reaching_in[n] = Union of Reaching_out[p] for all predecessors p
+            new_in = 0
+            for pred_id in pred_idx[pred_off[node_id]:pred_off[node_id + 1]]:
+                new_in |= reaching_out.get(pred_id, 0)
+            reaching_in[node_id] = new_in
+
+            # Reaching_out[n] = Gen[n] ∪ (Reaching_in[n] - Kill[n])
+            new_out = gen_bits[node_id] | (new_in & ~kill_bits[node_id])
+
+            if new_out != reaching_out[node_id]:
+                reaching_out[node_id] = new_out
+                for succ_id in succ_idx[succ_off[node_id]:succ_off[node_id + 1]]:
+                    if succ_id not in queued:
+                        queued.add(succ_id)
+                        worklist.append(succ_id)
+
+        self._reaching_cache = {
+            node_id: self._decode_definitions(bits, all_defs)
+            for node_id, bits in reaching_in.items()
+        }
+        return self._reaching_cache
+
+    @staticmethod
+    def _decode_definitions(bits: int, all_defs: List[tuple[str, int]]) -> Set[tuple[str, int]]:
+        """Convert a reaching-definitions bitset back into (variable, node_id) pairs."""
+        pairs = set()
+        while bits:
+            low = bits & -bits
+            pairs.add(all_defs[low.bit_length() - 1])
+            bits ^= low
+        return pairs
 
     def _gen_definitions(self, node: CFGNode) -> Set[tuple[str, int]]:
         """
@@ -288,36 +411,7 @@ class DataflowAnalyzer:
         if not node.statement:
             return set()
 
-        defined_vars = self.statement_parser.extract_variables_defined(node.statement)
-        return {(var, node.id) for var in defined_vars}
-
-    def _kill_definitions(
-        self,
-        node: CFGNode,
-        reaching_defs: Set[tuple[str, int]]
-    ) -> Set[tuple[str, int]]:
-        """
-        Compute KILL set for a node (definitions killed/overwritten).
-
-        Args:
-            node: CFG node
-            reaching_defs: Reaching definitions at this node
-
-        Returns:
-            Set of (variable, node_id) pairs that are killed
-        """
-        if not node.statement:
-            return set()
-
-        # Variables defined at this node kill previous definitions
-        defined_vars = self.statement_parser.extract_variables_defined(node.statement)
-
-        killed = set()
-        for var, def_node_id in reaching_defs:
-            if var in defined_vars and def_node_id != node.id:
-                killed.add((var, def_node_id))
-
-        return killed
+        return {(var, node.id) for var in self._defs[node.id]}
 
     def find_uninitialized_variables(self) -> List[Dict[str, Any]]:
         """
@@ -327,13 +421,10 @@ class DataflowAnalyzer:
             List of warnings about potentially uninitialized variables
         """
         warnings = []
-        reaching_defs = self.compute_reaching_definitions()
-
-        for node in self.cfg.nodes:
-            if not node.statement:
-                continue
+        reaching_defs = self._reaching_definitions()
 
-            used_vars = self.statement_parser.extract_variables_used(node.statement)
+        for node in self._stmt_nodes:
+            used_vars = self._uses[node.id]
 
             for var in used_vars:
                 # Check if this variable has any reaching definition
@@ -360,14 +451,14 @@ class DataflowAnalyzer:
             List of warnings about unused definitions
         """
         warnings = []
-        def_use_chains = self.analyze_def_use_chains()
+        def_use_chains = self._def_use_chains()
 
         for chain in def_use_chains:
-            if chain['definitions'] and not chain['uses']:
+            if chain.definitions and not chain.uses:
                 warnings.append({
-                    'variable': chain['variable'],
-                    'definition_nodes': chain['definitions'],
-                    'message': f"Variable '{chain['variable']}' is defined but never used"
+                    'variable': chain.variable,
+                    'definition_nodes': list(chain.definitions),
+                    'message': f"Variable '{chain.variable}' is defined but never used"
                 })
 
         return warnings
@@ -4,15 +4,93 @@ Serialization Support for Analysis Results
 Converts analysis results to JSON and YAML formats for output.
 """
 
+import io
 import json
-from typing import Any, Dict, List
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, BinaryIO, Dict, List, Tuple
 from pathlib import Path
 
+# PyYAML (and libyaml) is only imported when YAML output is requested
+YAML_AVAILABLE = find_spec('yaml') is not None
+
 try:
-    import yaml
-    YAML_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    YAML_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Output files are written through a large buffer, one result at a time
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Horizontal rule framing the summary text
+_SUMMARY_RULE = "=" * 60
+
+
+@lru_cache(maxsize=None)
+def _get_yaml() -> Tuple[Any, Any]:
+    """
+    Import PyYAML and build the dumper used for YAML output.
+
+    Returns:
+        Tuple of (yaml module, dumper class)
+
+    Raises:
+        ImportError: If PyYAML is not installed
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError(
+            "PyYAML is not installed. Install it with: pip install pyyaml"
+        ) from None
+
+    # libyaml-backed emitter when PyYAML was built with it
+    try:
+        from yaml import CSafeDumper as _SafeDumper
+    except ImportError:
+        from yaml import SafeDumper as _SafeDumper
+
+    class _YamlDumper(_SafeDumper):
+        """Safe dumper that writes str subclasses (e.g. str enums) as plain strings."""
+
+    _YamlDumper.add_multi_representer(
+        str, lambda dumper, data: dumper.represent_str(str(data))
+    )
+
+    return yaml, _YamlDumper
+
+
+def _to_serializable(data: Any) -> Any:
+    """Convert results (or a list of them) with a to_dict() method to plain data."""
+    to_dict = getattr(data, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    elif isinstance(data, list):
+        return list(map(_item_to_serializable, data))
+    return data
+
+
+def _item_to_serializable(item: Any) -> Any:
+    """Convert a single result to plain data."""
+    to_dict = getattr(item, 'to_dict', None)
+    return to_dict() if to_dict is not None else item
+
+
+def _dumps_json_str(data: Any, pretty: bool) -> str:
+    """Serialize plain data to a JSON string with the standard library."""
+    if pretty:
+        return json.dumps(data, indent=2, sort_keys=False)
+    else:
+        return json.dumps(data)
+
+
+def _dumps_json_bytes(data: Any, pretty: bool) -> bytes:
+    """Serialize plain data to UTF-8 encoded JSON."""
+    # orjson keeps insertion order like json.dumps, but is much faster
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return _dumps_json_str(data, pretty).encode('utf-8')
 
 
 def serialize_to_json(data: Any, pretty: bool = True) -> str:
@@ -26,16 +104,11 @@ def serialize_to_json(data: Any, pretty: bool = True) -> str:
     Returns:
         JSON string
     """
-    # Convert to dict if it has a to_dict method
-    if hasattr(data, 'to_dict'):
-        data = data.to_dict()
-    elif isinstance(data, list):
-        data = [item.to_dict() if hasattr(item, 'to_dict') else item for item in data]
+    data = _to_serializable(data)
 
-    if pretty:
-        return json.dumps(data, indent=2, sort_keys=False)
-    else:
-        return json.dumps(data)
+    if ORJSON_AVAILABLE:
+        return _dumps_json_bytes(data, pretty).decode('utf-8')
+    return _dumps_json_str(data, pretty)
 
 
 def serialize_to_yaml(data: Any) -> str:
@@ -51,18 +124,11 @@ def serialize_to_yaml(data: Any) -> str:
     Raises:
         ImportError: If PyYAML is not installed
     """
-    if not YAML_AVAILABLE:
-        raise ImportError(
-            "PyYAML is not installed. Install it with: pip install pyyaml"
-        )
+    yaml, dumper = _get_yaml()
 
-    # Convert to dict if it has a to_dict method
-    if hasattr(data, 'to_dict'):
-        data = data.to_dict()
-    elif isinstance(data, list):
-        data = [item.to_dict() if hasattr(item, 'to_dict') else item for item in data]
+    data = _to_serializable(data)
 
-    return yaml.dump(data, default_flow_style=False, sort_keys=False)
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False)
 
 
 def save_analysis_json(data: Any, output_path: Path, pretty: bool = True) -> None:
@@ -74,8 +140,44 @@ def save_analysis_json(data: Any, output_path: Path, pretty: bool = True) -> Non
         output_path: Path to output file
         pretty: Whether to pretty-print
     """
-    json_str = serialize_to_json(data, pretty=pretty)
-    output_path.write_text(json_str)
+    with output_path.open('wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        if isinstance(data, list) and not hasattr(data, 'to_dict'):
+            _write_json_list(f, data, pretty)
+        else:
+            f.write(_dumps_json_bytes(_to_serializable(data), pretty))
+
+
+def _write_json_list(f: BinaryIO, items: List[Any], pretty: bool) -> None:
+    """
+    Stream a JSON array to a file one item at a time.
+
+    Produces the same bytes as serializing the whole list at once, but only
+    one item is converted and encoded at a time.
+
+    Args:
+        f: Binary file to write to
+        items: Results to write
+        pretty: Whether to pretty-print
+    """
+    if not items:
+        f.write(b'[]')
+        return
+
+    if pretty:
+        start, separator, end = b'[\n  ', b',\n  ', b'\n]'
+    else:
+        start, separator, end = b'[', b',' if ORJSON_AVAILABLE else b', ', b']'
+
+    f.write(start)
+    for i, item in enumerate(items):
+        if i:
+            f.write(separator)
+        chunk = _dumps_json_bytes(_item_to_serializable(item), pretty)
+        if pretty:
+            # Nest the item one level; JSON strings never contain raw newlines
+            chunk = chunk.replace(b'\n', b'\n  ')
+        f.write(chunk)
+    f.write(end)
 
 
 def save_analysis_yaml(data: Any, output_path: Path) -> None:
@@ -89,8 +191,10 @@ def save_analysis_yaml(data: Any, output_path: Path) -> None:
     Raises:
         ImportError: If PyYAML is not installed
     """
-    yaml_str = serialize_to_yaml(data)
-    output_path.write_text(yaml_str)
+    yaml, dumper = _get_yaml()
+
+    with output_path.open('w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+        yaml.dump(_to_serializable(data), f, Dumper=dumper, default_flow_style=False, sort_keys=False)
 
 
 def save_analysis(
@@ -132,30 +236,26 @@ def format_summary_text(summary: Dict[str, Any]) -> str:
     Returns:
         Formatted text string
     """
-    lines = [
-        "=" * 60,
-        "Cairo Contract Analysis Summary",
-        "=" * 60,
-        "",
-        f"Contracts analyzed: {summary.get('total_contracts', 0)}",
-        f"Total functions: {summary.get('total_functions', 0)}",
-        f"  - With body: {summary.get('functions_with_body', 0)}",
-        f"  - Without body: {summary.get('functions_without_body', 0)}",
-        "",
-        "Analysis Results:",
-        f"  - Total warnings: {summary.get('total_warnings', 0)}",
-        f"  - Total errors: {summary.get('total_errors', 0)}",
-        "",
-        "Storage Access:",
-        f"  - Storage reads: {summary.get('total_storage_reads', 0)}",
-        f"  - Storage writes: {summary.get('total_storage_writes', 0)}",
-        "",
-        "External Calls:",
-        f"  - Total external calls: {summary.get('total_external_calls', 0)}",
-        "=" * 60,
-    ]
-
-    return '\n'.join(lines)
+    return f"""{_SUMMARY_RULE}
+Cairo Contract Analysis Summary
+{_SUMMARY_RULE}
+
+Contracts analyzed: {summary.get('total_contracts', 0)}
+Total functions: {summary.get('total_functions', 0)}
+  - With body: {summary.get('functions_with_body', 0)}
+  - Without body: {summary.get('functions_without_body', 0)}
+
+Analysis Results:
+  - Total warnings: {summary.get('total_warnings', 0)}
+  - Total errors: {summary.get('total_errors', 0)}
+
+Storage Access:
+  - Storage reads: {summary.get('total_storage_reads', 0)}
+  - Storage writes: {summary.get('total_storage_writes', 0)}
+
+External Calls:
+  - Total external calls: {summary.get('total_external_calls', 0)}
+{_SUMMARY_RULE}"""
 
 
 def format_warnings_text(results: List[Dict[str, Any]]) -> str:
@@ -168,7 +268,8 @@ def format_warnings_text(results: List[Dict[str, Any]]) -> str:
     Returns:
         Formatted warning text
     """
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
 
     for result in results:
         contract_name = result.get('contract', 'Unknown')
@@ -179,18 +280,23 @@ def format_warnings_text(results: List[Dict[str, Any]]) -> str:
             warnings = func.get('warnings', [])
 
             if warnings:
-                lines.append(f"\n{contract_name}::{func_name}:")
+                # Lines are newline-separated; each function's block also
+                # starts with a blank line
+                if buf.tell():
+                    write('\n')
+                write(f"\n{contract_name}::{func_name}:")
                 for warning in warnings:
-                    warn_type = warning.get('type', 'unknown')
-                    message = warning.get('message', '')
-                    line_num = warning.get('line', '')
+                    get = warning.get
+                    warn_type = get('type', 'unknown')
+                    message = get('message', '')
+                    line_num = get('line', '')
 
                     if line_num:
-                        lines.append(f"  Line {line_num}: [{warn_type}] {message}")
+                        write(f"\n  Line {line_num}: [{warn_type}] {message}")
                     else:
-                        lines.append(f"  [{warn_type}] {message}")
+                        write(f"\n  [{warn_type}] {message}")
 
-    if not lines:
+    if not buf.tell():
         return "No warnings found."
 
-    return '\n'.join(lines)
+    return buf.getvalue()
@@ -5,14 +5,30 @@ Parses Cairo function bodies into structured statement representations
 for control flow and data flow analysis.
 """
 
+import multiprocessing
+import os
 import re
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, field
+import sys
+from array import array
+from functools import lru_cache
+from typing import ClassVar, Iterator, List, Optional, Dict, Tuple, Pattern, Any
+from dataclasses import dataclass
 from enum import Enum
 
+from cairo_parser._compat import DATACLASS_SLOTS
+
+
+class StatementType(str, Enum):
+    """
+    Types of statements in Cairo code.
+
+    Members are strings equal to their values, so they can be placed in
+    serialized output as they are.
+    """
+    # Format as the plain value, like enum.StrEnum (Python 3.11+)
+    __str__ = str.__str__
+    __format__ = str.__format__
 
-class StatementType(Enum):
-    """Types of statements in Cairo code."""
     ASSIGNMENT = "assignment"
     IF = "if"
     ELSE = "else"
@@ -32,6 +48,10 @@ class StatementType(Enum):
 @dataclass
 class Statement:
     """Base class for all statement types."""
+    # Slots are declared by hand: dataclass(slots=True) would recreate the
+    # classes and break the zero-argument super() calls in their __init__
+    __slots__ = ('stmt_type', 'line', 'raw_text', 'block_depth')
+
     stmt_type: StatementType
     line: int
     raw_text: str
@@ -40,7 +60,7 @@ class Statement:
     def to_dict(self) -> Dict[str, Any]:
         """Convert statement to dictionary for serialization."""
         return {
-            'type': self.stmt_type.value,
+            'type': self.stmt_type,
             'line': self.line,
             'raw_text': self.raw_text,
             'block_depth': self.block_depth
@@ -50,6 +70,8 @@ class Statement:
 @dataclass
 class AssignmentStmt(Statement):
     """Variable assignment: x = expr;"""
+    __slots__ = ('variable', 'expression')
+
     variable: str
     expression: str
 
@@ -59,15 +81,21 @@ class AssignmentStmt(Statement):
         self.expression = expression
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        d['variable'] = self.variable
-        d['expression'] = self.expression
-        return d
+        return {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+            'variable': self.variable,
+            'expression': self.expression,
+        }
 
 
 @dataclass
 class LetBindingStmt(Statement):
     """Let binding: let x = expr; or let mut x = expr;"""
+    __slots__ = ('variable', 'expression', 'is_mutable')
+
     variable: str
     expression: str
     is_mutable: bool
@@ -79,18 +107,24 @@ class LetBindingStmt(Statement):
         self.is_mutable = is_mutable
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        d['variable'] = self.variable
-        d['expression'] = self.expression
-        d['is_mutable'] = self.is_mutable
-        return d
+        return {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+            'variable': self.variable,
+            'expression': self.expression,
+            'is_mutable': self.is_mutable,
+        }
 
 
 @dataclass
 class IfStmt(Statement):
     """If statement: if condition { ... }"""
+    __slots__ = ('condition', 'has_else')
+
     condition: str
-    has_else: bool = False
+    has_else: bool
 
     def __init__(self, condition: str, line: int, raw_text: str, has_else: bool = False, block_depth: int = 0):
         super().__init__(StatementType.IF, line, raw_text, block_depth)
@@ -98,17 +132,23 @@ class IfStmt(Statement):
         self.has_else = has_else
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        d['condition'] = self.condition
-        d['has_else'] = self.has_else
-        return d
+        return {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+            'condition': self.condition,
+            'has_else': self.has_else,
+        }
 
 
 @dataclass
 class ElseStmt(Statement):
     """Else statement: else { ... } or else if ..."""
-    is_else_if: bool = False
-    condition: Optional[str] = None
+    __slots__ = ('is_else_if', 'condition')
+
+    is_else_if: bool
+    condition: Optional[str]
 
     def __init__(self, line: int, raw_text: str, is_else_if: bool = False, condition: Optional[str] = None, block_depth: int = 0):
         super().__init__(StatementType.ELSE, line, raw_text, block_depth)
@@ -116,8 +156,13 @@ class ElseStmt(Statement):
         self.condition = condition
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        d['is_else_if'] = self.is_else_if
+        d = {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+            'is_else_if': self.is_else_if,
+        }
         if self.condition:
             d['condition'] = self.condition
         return d
@@ -126,8 +171,10 @@ class ElseStmt(Statement):
 @dataclass
 class MatchStmt(Statement):
     """Match expression: match expr { pattern => result, ... }"""
+    __slots__ = ('expression', 'arms')
+
     expression: str
-    arms: List[Dict[str, str]] = field(default_factory=list)
+    arms: List[Dict[str, str]]
 
     def __init__(self, expression: str, line: int, raw_text: str, arms: Optional[List[Dict[str, str]]] = None, block_depth: int = 0):
         super().__init__(StatementType.MATCH, line, raw_text, block_depth)
@@ -135,15 +182,21 @@ class MatchStmt(Statement):
         self.arms = arms or []
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        d['expression'] = self.expression
-        d['arms'] = self.arms
-        return d
+        return {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+            'expression': self.expression,
+            'arms': self.arms,
+        }
 
 
 @dataclass
 class ReturnStmt(Statement):
     """Return statement: return expr;"""
+    __slots__ = ('expression',)
+
     expression: Optional[str]
 
     def __init__(self, expression: Optional[str], line: int, raw_text: str, block_depth: int = 0):
@@ -151,7 +204,12 @@ class ReturnStmt(Statement):
         self.expression = expression
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
+        d = {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+        }
         if self.expression:
             d['expression'] = self.expression
         return d
@@ -160,9 +218,11 @@ class ReturnStmt(Statement):
 @dataclass
 class CallStmt(Statement):
     """Function call: function(args)"""
+    __slots__ = ('function_name', 'arguments', 'is_external')
+
     function_name: str
     arguments: List[str]
-    is_external: bool = False
+    is_external: bool
 
     def __init__(self, function_name: str, arguments: List[str], line: int, raw_text: str, is_external: bool = False, block_depth: int = 0):
         super().__init__(StatementType.CALL, line, raw_text, block_depth)
@@ -171,16 +231,22 @@ class CallStmt(Statement):
         self.is_external = is_external
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        d['function_name'] = self.function_name
-        d['arguments'] = self.arguments
-        d['is_external'] = self.is_external
-        return d
+        return {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+            'function_name': self.function_name,
+            'arguments': self.arguments,
+            'is_external': self.is_external,
+        }
 
 
 @dataclass
 class StorageReadStmt(Statement):
     """Storage read: self.storage_var.read()"""
+    __slots__ = ('storage_var',)
+
     storage_var: str
 
     def __init__(self, storage_var: str, line: int, raw_text: str, block_depth: int = 0):
@@ -188,14 +254,20 @@ class StorageReadStmt(Statement):
         self.storage_var = storage_var
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        d['storage_var'] = self.storage_var
-        return d
+        return {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+            'storage_var': self.storage_var,
+        }
 
 
 @dataclass
 class StorageWriteStmt(Statement):
     """Storage write: self.storage_var.write(value)"""
+    __slots__ = ('storage_var', 'value')
+
     storage_var: str
     value: str
 
@@ -205,17 +277,23 @@ class StorageWriteStmt(Statement):
         self.value = value
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        d['storage_var'] = self.storage_var
-        d['value'] = self.value
-        return d
+        return {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+            'storage_var': self.storage_var,
+            'value': self.value,
+        }
 
 
 @dataclass
 class AssertStmt(Statement):
     """Assert statement: assert(condition, 'message') or assert!(condition)"""
+    __slots__ = ('condition', 'message')
+
     condition: str
-    message: Optional[str] = None
+    message: Optional[str]
 
     def __init__(self, condition: str, line: int, raw_text: str, message: Optional[str] = None, block_depth: int = 0):
         super().__init__(StatementType.ASSERT, line, raw_text, block_depth)
@@ -223,13 +301,205 @@ class AssertStmt(Statement):
         self.message = message
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        d['condition'] = self.condition
+        d = {
+            'type': self.stmt_type,
+            'line': self.line,
+            'raw_text': self.raw_text,
+            'block_depth': self.block_depth,
+            'condition': self.condition,
+        }
         if self.message:
             d['message'] = self.message
         return d
 
 
+def _build_statement(kind: str, fields: Tuple[Any, ...], line: int, raw_text: str) -> Statement:
+    """
+    Create the statement for a classified line.
+
+    Args:
+        kind: Name of the matched STATEMENT_PATTERNS entry
+        fields: Statement fields extracted by the classifier
+        line: Line number
+        raw_text: Stripped source line
+
+    Returns:
+        Statement object
+    """
+    # Storage read/write first (more specific)
+    if kind == 'storage_write':
+        return StorageWriteStmt(
+            storage_var=fields[0],
+            value=fields[1],
+            line=line,
+            raw_text=raw_text
+        )
+
+    if kind == 'storage_read':
+        return StorageReadStmt(
+            storage_var=fields[0],
+            line=line,
+            raw_text=raw_text
+        )
+
+    # Control flow statements
+    if kind == 'if':
+        return IfStmt(
+            condition=fields[0],
+            line=line,
+            raw_text=raw_text
+        )
+
+    if kind == 'else_if':
+        return ElseStmt(
+            line=line,
+            raw_text=raw_text,
+            is_else_if=True,
+            condition=fields[0]
+        )
+
+    if kind == 'else':
+        return ElseStmt(
+            line=line,
+            raw_text=raw_text
+        )
+
+    if kind == 'match':
+        return MatchStmt(
+            expression=fields[0],
+            line=line,
+            raw_text=raw_text
+        )
+
+    if kind == 'return':
+        return ReturnStmt(
+            expression=fields[0],
+            line=line,
+            raw_text=raw_text
+        )
+
+    if kind == 'assert':
+        return AssertStmt(
+            condition=fields[0],
+            line=line,
+            raw_text=raw_text
+        )
+
+    if kind == 'let_binding':
+        return LetBindingStmt(
+            variable=fields[0],
+            expression=fields[1],
+            is_mutable=fields[2],
+            line=line,
+            raw_text=raw_text
+        )
+
+    if kind == 'assignment':
+        return AssignmentStmt(
+            variable=fields[0],
+            expression=fields[1],
+            line=line,
+            raw_text=raw_text
+        )
+
+    # Function call; the argument list is copied since statements own it
+    return CallStmt(
+        function_name=fields[0],
+        arguments=list(fields[1]),
+        line=line,
+        raw_text=raw_text,
+        is_external=fields[2]
+    )
+
+
+# Statement type produced by each classifier pattern
+_KIND_TYPES = {
+    'storage_write': StatementType.STORAGE_WRITE,
+    'storage_read': StatementType.STORAGE_READ,
+    'if': StatementType.IF,
+    'else_if': StatementType.ELSE,
+    'else': StatementType.ELSE,
+    'match': StatementType.MATCH,
+    'return': StatementType.RETURN,
+    'assert': StatementType.ASSERT,
+    'let_binding': StatementType.LET_BINDING,
+    'assignment': StatementType.ASSIGNMENT,
+    'function_call': StatementType.CALL,
+}
+
+# Classifier pattern for each statement type (ELSE is told apart by its fields)
+_TYPE_KINDS = {stmt_type: kind for kind, stmt_type in _KIND_TYPES.items() if kind != 'else_if'}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class StatementBatch:
+    """
+    Statements of a function body stored column-wise.
+
+    Holds the same information as the list returned by
+    StatementParser.parse, but in parallel arrays instead of one object per
+    statement, which is much smaller and faster to scan in bulk (e.g.
+    counting storage writes). Statement objects are created on demand by
+    indexing.
+    """
+    # Statement types, by the codes stored in types
+    TYPES: ClassVar[Tuple[StatementType, ...]] = tuple(StatementType)
+
+    types: array  # Code of each statement's type in TYPES
+    lines: array
+    depths: array
+    fields: List[Tuple[Any, ...]]  # Type-specific fields (variable, condition, ...)
+    text: str  # raw_text of all statements, concatenated
+    offsets: array  # raw_text of statement i is text[offsets[i]:offsets[i + 1]]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Statement:
+        """Create the Statement at index."""
+        # Normalizes negative indices and raises IndexError when out of range
+        index = range(len(self.types))[index]
+        stmt_type = self.TYPES[self.types[index]]
+        fields = self.fields[index]
+        if stmt_type is StatementType.ELSE:
+            kind = 'else_if' if fields else 'else'
+        else:
+            kind = _TYPE_KINDS[stmt_type]
+
+        offsets = self.offsets
+        stmt = _build_statement(
+            kind, fields, self.lines[index],
+            self.text[offsets[index]:offsets[index + 1]]
+        )
+        stmt.block_depth = self.depths[index]
+        return stmt
+
+    def __iter__(self) -> Iterator[Statement]:
+        return map(self.__getitem__, range(len(self.types)))
+
+    def count(self, stmt_type: StatementType) -> int:
+        """
+        Count statements of a type without creating them.
+
+        Args:
+            stmt_type: Statement type to count
+
+        Returns:
+            Number of statements of that type
+        """
+        return self.types.count(self.TYPES.index(stmt_type))
+
+    def to_statements(self) -> List[Statement]:
+        """Create all statements, as StatementParser.parse would return them."""
+        return list(self)
+
+
+# Code stored in StatementBatch.types for each classifier pattern
+_KIND_CODES = {
+    kind: StatementBatch.TYPES.index(stmt_type)
+    for kind, stmt_type in _KIND_TYPES.items()
+}
+
 class StatementParser:
     """
     Parser for Cairo function statements.
@@ -258,6 +528,31 @@ class StatementParser:
         'block_end': r'\}',
     }
 
+    # Patterns that classify a line, most specific first, with substrings a
+    # line must contain for the pattern to have any chance of matching
+    STATEMENT_PATTERNS = {
+        'storage_write': ('self.', '('),
+        'storage_read': ('self.', '('),
+        'if': ('if', '{'),
+        'else_if': ('else', '{'),
+        'else': ('else', '{'),
+        'match': ('match', '{'),
+        'return': ('return',),
+        'assert': ('assert', '('),
+        'let_binding': ('let', '='),
+        'assignment': ('=',),
+        'function_call': ('(',),
+    }
+
+    # Identifiers (variable names) in an expression
+    _VAR_RE = re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b')
+
+    # Brackets and commas delimiting call arguments
+    _ARG_DELIM_RE = re.compile(r'[,()\[\]{}]')
+
+    # Keywords and literals that look like identifiers
+    _KEYWORDS = frozenset({'let', 'mut', 'if', 'else', 'match', 'return', 'true', 'false', 'self'})
+
     def __init__(self):
         """Initialize the statement parser."""
         self.compiled_patterns = {
@@ -265,6 +560,56 @@ class StatementParser:
             for name, pattern in self.PATTERNS.items()
         }
 
+        # Combined classifier regexes, keyed by which literals a line contains
+        self._literals = tuple(dict.fromkeys(
+            literal
+            for literals in self.STATEMENT_PATTERNS.values()
+            for literal in literals
+        ))
+        self._statement_res: Dict[Tuple[bool, ...], Optional[Pattern[str]]] = {}
+
+        # Identical lines (boilerplate returns, counters, ...) recur across
+        # functions and files, so classification is memoized on the text
+        self._classify = lru_cache(maxsize=8192)(self._classify_line)
+
+    # Short lines ('}', 'return ();', counters) repeat across a codebase, so
+    # their raw_text is interned; longer lines are rarely identical
+    INTERN_MAX_LENGTH = 80
+
+    # Below this many bodies, worker startup costs more than it saves
+    PARALLEL_THRESHOLD = 16
+
+    def __reduce__(self):
+        """Pickle as a fresh parser; the caches are rebuilt in the receiver."""
+        return (type(self), ())
+
+    def _compile_statement_re(self, key: Tuple[bool, ...]) -> Optional[Pattern[str]]:
+        """
+        Build the combined regex that classifies a line in a single call.
+
+        Each alternative is a lookahead searching the whole line, tried in
+        STATEMENT_PATTERNS order, so the first pattern found anywhere wins just
+        as with successive searches. Patterns whose literals are missing from
+        the line are left out.
+
+        Args:
+            key: Whether the line contains each of self._literals
+
+        Returns:
+            Compiled regex, or None if no pattern can match the line
+        """
+        present = {literal for literal, found in zip(self._literals, key) if found}
+        names = [
+            name for name, literals in self.STATEMENT_PATTERNS.items()
+            if present.issuperset(literals)
+        ]
+        regex = re.compile('^(?:' + '|'.join(
+            f'(?=.*?(?P<{name}>{self.PATTERNS[name]}))' for name in names
+        ) + ')') if names else None
+
+        self._statement_res[key] = regex
+        return regex
+
     def parse(self, function_body: str, start_line: int = 1) -> List[Statement]:
         """
         Parse function body into list of statements with block depth tracking.
@@ -277,35 +622,103 @@ class StatementParser:
             List of Statement objects with block_depth set
         """
         statements = []
-        lines = function_body.split('\n')
         current_depth = 0
+        parse_stripped = self._parse_stripped
 
-        for i, line in enumerate(lines):
-            line_num = start_line + i
-
-            # Track opening braces to determine current depth
-            # We need to track depth BEFORE parsing the line content
-            line_depth = current_depth
+        for line_num, line in enumerate(function_body.split('\n'), start_line):
+            stripped = line.strip()
+            if not stripped:
+                # Blank lines hold neither statements nor braces
+                continue
 
             # Count braces in this line
-            open_count = line.count('{')
-            close_count = line.count('}')
+            open_count = stripped.count('{')
 
-            stmt = self._parse_line(line, line_num)
+            stmt = parse_stripped(stripped, line_num)
             if stmt:
                 # Set the block depth for control flow statements
                 if isinstance(stmt, (IfStmt, ElseStmt, MatchStmt)):
                     stmt.block_depth = current_depth
                 else:
                     # Regular statements use current depth after opening braces
-                    stmt.block_depth = current_depth + (1 if '{' in line else 0)
+                    stmt.block_depth = current_depth + (1 if open_count else 0)
                 statements.append(stmt)
 
             # Update depth AFTER processing the line
-            current_depth += open_count - close_count
+            current_depth += open_count - stripped.count('}')
 
         return statements
 
+    def parse_batch(self, function_body: str, start_line: int = 1) -> StatementBatch:
+        """
+        Parse function body into a column-wise StatementBatch.
+
+        Equivalent to parse, without creating a Statement object per line.
+
+        Args:
+            function_body: Raw function body text
+            start_line: Starting line number (for accurate line tracking)
+
+        Returns:
+            StatementBatch with the body's statements
+        """
+        types = array('B')
+        lines = array('l')
+        depths = array('l')
+        fields_list = []
+        texts = []
+        offsets = array('l', [0])
+        classify = self._classify
+        current_depth = 0
+        end = 0
+
+        for line_num, line in enumerate(function_body.split('\n'), start_line):
+            stripped = line.strip()
+            if not stripped:
+                continue
+
+            open_count = stripped.count('{')
+
+            classified = None if stripped.startswith('//') else classify(stripped)
+            if classified is not None:
+                kind, fields = classified
+                types.append(_KIND_CODES[kind])
+                lines.append(line_num)
+                # Same depth rules as parse
+                if kind in ('if', 'else_if', 'else', 'match'):
+                    depths.append(current_depth)
+                else:
+                    depths.append(current_depth + (1 if open_count else 0))
+                fields_list.append(fields)
+                texts.append(stripped)
+                end += len(stripped)
+                offsets.append(end)
+
+            current_depth += open_count - stripped.count('}')
+
+        return StatementBatch(types, lines, depths, fields_list, ''.join(texts), offsets)
+
+    def parse_many(self, bodies: List[Tuple[str, int]]) -> List[List[Statement]]:
+        """
+        Parse many function bodies, using worker processes for large batches.
+
+        Parsing is CPU-bound Python, so on multi-core machines batches of more
+        than PARALLEL_THRESHOLD bodies are spread over a multiprocessing pool
+        (one process per CPU). On platforms that spawn workers, call this from
+        under an ``if __name__ == '__main__':`` guard.
+
+        Args:
+            bodies: (function_body, start_line) pairs
+
+        Returns:
+            Statement lists, in the same order as bodies
+        """
+        if len(bodies) <= self.PARALLEL_THRESHOLD or (os.cpu_count() or 1) < 2:
+            return [self.parse(body, start_line) for body, start_line in bodies]
+
+        with multiprocessing.Pool() as pool:
+            return pool.starmap(self.parse, bodies)
+
     def parse_with_blocks(self, function_body: str, start_line: int = 1) -> tuple[List[Statement], List[int]]:
         """
         Parse function body with block depth tracking.
@@ -326,11 +739,7 @@ class StatementParser:
             line_num = start_line + i
 
             # Update depth based on braces BEFORE this line
-            for char in line:
-                if char == '{':
-                    current_depth += 1
-                elif char == '}':
-                    current_depth -= 1
+            current_depth += line.count('{') - line.count('}')
 
             stmt = self._parse_line(line, line_num)
             if stmt:
@@ -357,126 +766,133 @@ class StatementParser:
         """
         stripped = line.strip()
 
-        # Skip empty lines and comments
+        # Skip empty lines
         if not stripped:
             return None
 
+        return self._parse_stripped(stripped, line_num)
+
+    def _parse_stripped(self, stripped: str, line_num: int) -> Optional[Statement]:
+        """
+        Parse a non-empty, already stripped line into a statement.
+
+        Args:
+            stripped: Source code line without surrounding whitespace
+            line_num: Line number
+
+        Returns:
+            Statement object or None
+        """
+        # Skip comments
         if stripped.startswith('//'):
             return None
 
-        # Check for storage read/write first (more specific)
-        if 'self.' in stripped:
-            storage_write_match = self.compiled_patterns['storage_write'].search(stripped)
-            if storage_write_match:
-                return StorageWriteStmt(
-                    storage_var=storage_write_match.group(1),
-                    value=storage_write_match.group(2),
-                    line=line_num,
-                    raw_text=stripped
-                )
-
-            storage_read_match = self.compiled_patterns['storage_read'].search(stripped)
-            if storage_read_match:
-                return StorageReadStmt(
-                    storage_var=storage_read_match.group(1),
-                    line=line_num,
-                    raw_text=stripped
-                )
-
-        # Check for control flow statements
-        if_match = self.compiled_patterns['if'].search(stripped)
-        if if_match:
-            return IfStmt(
-                condition=if_match.group(1).strip(),
-                line=line_num,
-                raw_text=stripped
-            )
-
-        else_if_match = self.compiled_patterns['else_if'].search(stripped)
-        if else_if_match:
-            return ElseStmt(
-                line=line_num,
-                raw_text=stripped,
-                is_else_if=True,
-                condition=else_if_match.group(1).strip()
-            )
-
-        else_match = self.compiled_patterns['else'].search(stripped)
-        if else_match:
-            return ElseStmt(
-                line=line_num,
-                raw_text=stripped
-            )
-
-        match_match = self.compiled_patterns['match'].search(stripped)
-        if match_match:
-            return MatchStmt(
-                expression=match_match.group(1).strip(),
-                line=line_num,
-                raw_text=stripped
-            )
-
-        # Check for return statement
-        return_match = self.compiled_patterns['return'].search(stripped)
-        if return_match:
-            expr = return_match.group(1) if return_match.group(1) else None
-            return ReturnStmt(
-                expression=expr,
-                line=line_num,
-                raw_text=stripped
-            )
-
-        # Check for assert
-        assert_match = self.compiled_patterns['assert'].search(stripped)
-        if assert_match:
-            return AssertStmt(
-                condition=assert_match.group(1),
-                line=line_num,
-                raw_text=stripped
-            )
-
-        # Check for let binding
-        let_match = self.compiled_patterns['let_binding'].search(stripped)
-        if let_match:
-            is_mut = let_match.group(1) is not None
-            return LetBindingStmt(
-                variable=let_match.group(2),
-                expression=let_match.group(3).strip(),
-                is_mutable=is_mut,
-                line=line_num,
-                raw_text=stripped
-            )
-
-        # Check for assignment
-        assignment_match = self.compiled_patterns['assignment'].search(stripped)
-        if assignment_match:
-            return AssignmentStmt(
-                variable=assignment_match.group(1),
-                expression=assignment_match.group(2).strip(),
-                line=line_num,
-                raw_text=stripped
-            )
-
-        # Check for function call
-        call_match = self.compiled_patterns['function_call'].search(stripped)
-        if call_match:
-            func_name = call_match.group(1)
-            args_str = call_match.group(2)
-            args = [arg.strip() for arg in args_str.split(',') if arg.strip()]
-
-            # Simple heuristic: external calls often have dispatcher pattern
-            is_external = 'dispatcher' in stripped.lower() or '::' in stripped
-
-            return CallStmt(
-                function_name=func_name,
-                arguments=args,
-                line=line_num,
-                raw_text=stripped,
-                is_external=is_external
-            )
-
-        # If no specific pattern matched, return None
-        return None
+        classified = self._classify(stripped)
+        if classified is None:
+            # If no specific pattern matched, return None
+            return None
+
+        kind, fields = classified
+
+        if len(stripped) < self.INTERN_MAX_LENGTH:
+            stripped = sys.intern(stripped)
+
+        return _build_statement(kind, fields, line_num, stripped)
+
+    def _classify_line(self, stripped: str) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+        """
+        Classify a stripped line and extract the fields of its statement.
+
+        Pure function of the text, memoized per parser as self._classify.
+
+        Args:
+            stripped: Source code line without surrounding whitespace
+
+        Returns:
+            (pattern name, statement fields) or None if no pattern matches
+        """
+        key = tuple(map(stripped.__contains__, self._literals))
+        try:
+            regex = self._statement_res[key]
+        except KeyError:
+            regex = self._compile_statement_re(key)
+
+        m = regex.match(stripped) if regex else None
+        if not m:
+            return None
+
+        kind = m.lastgroup
+        # Captures of the matched pattern follow its named group: group[0] is
+        # what the pattern alone would report as group(1)
+        group = m.groups()[regex.groupindex[kind]:]
+
+        if kind == 'storage_write':
+            return kind, (group[0], group[1])
+
+        if kind in ('storage_read', 'assert'):
+            return kind, (group[0],)
+
+        if kind in ('if', 'else_if', 'match'):
+            return kind, (group[0].strip(),)
+
+        if kind == 'else':
+            return kind, ()
+
+        if kind == 'return':
+            return kind, (group[0] if group[0] else None,)
+
+        if kind == 'let_binding':
+            is_mut = group[0] is not None
+            return kind, (group[1], group[2].strip(), is_mut)
+
+        if kind == 'assignment':
+            return kind, (group[0], group[1].strip())
+
+        # Function call; the pattern stops at the first ')', so arguments are
+        # scanned from the opening paren to its matching close
+        func_name = group[0]
+        args = self._split_arguments(stripped, m.start(regex.groupindex[kind] + 2))
+
+        # Simple heuristic: external calls often have dispatcher pattern
+        is_external = 'dispatcher' in stripped.lower() or '::' in stripped
+
+        return kind, (func_name, args, is_external)
+
+    def _split_arguments(self, text: str, start: int) -> Tuple[str, ...]:
+        """
+        Split a call's argument list on top-level commas.
+
+        Commas inside nested parentheses, brackets or braces belong to the
+        enclosing argument.
+
+        Args:
+            text: Line containing the call
+            start: Index just past the call's opening parenthesis
+
+        Returns:
+            Stripped, non-empty arguments
+        """
+        args = []
+        depth = 0
+        arg_start = start
+        end = len(text)
+
+        for m in self._ARG_DELIM_RE.finditer(text, start):
+            char = m.group()
+            if char == ',':
+                if not depth:
+                    args.append(text[arg_start:m.start()])
+                    arg_start = m.end()
+            elif char in '([{':
+                depth += 1
+            elif depth:
+                depth -= 1
+            elif char == ')':
+                end = m.start()
+                break
+
+        args.append(text[arg_start:end])
+        return tuple(arg for arg in map(str.strip, args) if arg)
 
     def extract_variables_used(self, statement: Statement) -> List[str]:
         """
@@ -528,12 +944,8 @@ class StatementParser:
 
         Simple regex-based extraction of identifiers.
         """
-        # Match identifiers (variable names)
-        var_pattern = r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b'
-        matches = re.findall(var_pattern, expression)
-
-        # Filter out keywords and literals
-        keywords = {'let', 'mut', 'if', 'else', 'match', 'return', 'true', 'false', 'self'}
-        variables = [m for m in matches if m not in keywords]
-
-        return variables
+        # Match identifiers, filtering out keywords and literals
+        return [
+            name for name in self._VAR_RE.findall(expression)
+            if name not in self._KEYWORDS
+        ]
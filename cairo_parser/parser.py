@@ -9,13 +9,113 @@ Parses Cairo smart contracts with assembler-style multi-pass linking:
 Works for both Cairo 0 and Cairo 1 using regex pattern matching.
 """
 
+import os
 import re
-from typing import Dict, List, Set, Optional, Any
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Set, Optional, Any, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 
+from cairo_parser._compat import DATACLASS_SLOTS
 
-@dataclass
+
+# Cairo 0 import: from module import Item
+_CAIRO0_IMPORT_RE = re.compile(r'from\s+([\w.]+)\s+import\s+([^\n]+)')
+
+# Cairo 1 import: use module::{Item1, Item2}; (group 2 holds the items) or
+# use module::Item; / use module;
+# Only matches starting a line count; that is checked separately, since a
+# leading 'use' lets the regex engine skip ahead to candidates
+_USE_RE = re.compile(r'use [^\S\n]*([\w:]+)(?:::\{([^}\n]+)\})?;')
+
+# Module declaration: mod Name, pub mod Name, etc.
+_MOD_RE = re.compile(r'mod\s+(\w+)')
+
+# Storage variable: name: Type
+_STORAGE_VAR_RE = re.compile(r'(\w+)\s*:\s*([^,]+)')
+
+# Function declaration: fn function_name
+_FN_RE = re.compile(r'fn\s+(\w+)')
+
+# Function return type on the declaration line
+_FN_RETURNS_RE = re.compile(r'->\s*([^{;]+)')
+
+# Characters that delimit parameters or change their nesting depth
+_PARAM_DELIM_RE = re.compile(r'[,()<>\[\]]')
+
+# Event declaration: struct EventName or enum EventName
+_EVENT_RE = re.compile(r'(?:struct|enum)\s+(\w+)')
+_EVENT_PREFIXES = ('enum ', 'struct ')
+
+# Version markers, most common first: a Cairo 1 file usually has an 'fn '
+# near the top, so the rarer markers are only searched for when it doesn't
+_CAIRO1_MARKERS = ('fn ', 'felt252', '#[storage]', '#[starknet::contract]', '#[starknet::interface]')
+_CAIRO0_MARKERS = ('func ', '@external', '@view', '@storage_var')
+
+
+def _split_parameters(line: str, start: int) -> Optional[Tuple[List[str], int]]:
+    """
+    Split a function's parameter list on top-level commas.
+
+    Commas inside generic arguments (Map<K, V>), tuples or arrays belong to
+    the enclosing parameter, and the list ends at the parenthesis matching
+    the opening one rather than the first ')'.
+
+    Args:
+        line: Declaration line
+        start: Index just past the parameter list's opening parenthesis
+
+    Returns:
+        Tuple of (raw parameter strings, index of the matching ')'), or
+        None if the list is not closed on this line
+    """
+    params = []
+    depth = 0
+    param_start = start
+
+    for m in _PARAM_DELIM_RE.finditer(line, start):
+        char = m.group()
+        if char == ',':
+            if not depth:
+                params.append(line[param_start:m.start()])
+                param_start = m.end()
+        elif char in '(<[':
+            depth += 1
+        elif char == '>':
+            # The '>' of a '->' in a function type is not a closing bracket
+            if depth and line[m.start() - 1] != '-':
+                depth -= 1
+        elif depth:
+            depth -= 1
+        elif char == ')':
+            params.append(line[param_start:m.start()])
+            return params, m.start()
+
+    return None
+
+
+def _read_source(file_path: Path) -> str:
+    """
+    Read a Cairo source file as text.
+
+    Decodes the raw bytes as UTF-8 directly instead of going through a
+    locale-dependent text stream, translating newlines as text mode would.
+
+    Args:
+        file_path: Path to Cairo file
+
+    Returns:
+        Source code, with all line endings converted to newlines
+    """
+    source_code = file_path.read_bytes().decode('utf-8')
+    if '\r' in source_code:
+        source_code = source_code.replace('\r\n', '\n').replace('\r', '\n')
+    return source_code
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FunctionInfo:
     """Information about a Cairo function."""
     name: str
@@ -32,7 +132,7 @@ class FunctionInfo:
     body_text: Optional[str] = None  # Raw function body as string
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StorageVarInfo:
     """Information about a Cairo storage variable."""
     name: str
@@ -41,7 +141,7 @@ class StorageVarInfo:
     is_stub: bool = False
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EventInfo:
     """Information about a Cairo event."""
     name: str
@@ -50,7 +150,7 @@ class EventInfo:
     is_stub: bool = False
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ImportInfo:
     """Information about an import statement."""
     module_path: str
@@ -60,7 +160,7 @@ class ImportInfo:
     stub_created: bool = False
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ContractInfo:
     """Complete information about a Cairo contract/module."""
     name: str
@@ -75,7 +175,7 @@ class ContractInfo:
     # Stubbing metadata
     unresolved_calls: Set[str] = field(default_factory=set)  # Calls to missing functions
     unresolved_types: Set[str] = field(default_factory=set)  # References to missing types
-    stub_modules: Dict[str, 'ContractInfo'] = field(default_factory=dict)  # Created stubs
+    stub_modules: Dict[str, 'ContractInfo'] = field(default_factory=dict)  # Created stubs (shared between contracts)
 
     # Parsing metadata
     parse_errors: List[str] = field(default_factory=list)
@@ -91,13 +191,21 @@ class CairoParser:
     similar to unresolved symbols in assembly object files.
     """
 
-    def __init__(self):
+    def __init__(self, extract_bodies: bool = True):
         """
         Initialize Cairo parser.
 
         Uses regex parsing for both Cairo 0 and Cairo 1.
         Includes GOT/PLT-style symbol resolution for stubbing.
+
+        Args:
+            extract_bodies: If True, keep each function's body text and line
+                range for control flow and dataflow analysis. Without it,
+                parsing skips the brace matching and the body text is not held
+                in memory.
         """
+        self.extract_bodies = extract_bodies
+
         # Symbol registry: Maps symbol names to their definitions (like GOT)
         self.symbol_registry: Dict[str, ContractInfo] = {}
 
@@ -110,6 +218,13 @@ class CairoParser:
         # Parsed files cache: Avoid reparsing
         self.parsed_files: Dict[str, Dict[str, ContractInfo]] = {}
 
+        # Module lookup caches: (module path, search root) -> file, and
+        # importing directory -> project root
+        self._module_file_cache: Dict[Tuple[str, Path], Optional[Path]] = {}
+        self._project_roots: Dict[Path, Path] = {}
+
+    # Below this many files, worker startup costs more than parsing in Pass 1
+    PARALLEL_THRESHOLD = 32
 
     def parse_file(self, file_path: Path, stub_missing: bool = True, _recursive: bool = False) -> Dict[str, ContractInfo]:
         """
@@ -127,7 +242,7 @@ class CairoParser:
         Args:
             file_path: Path to Cairo file
             stub_missing: If True, create stubs for missing imports
-            _recursive: Internal flag to track recursive parsing
+            _recursive: Unused; kept for backward compatibility
 
         Returns:
             Dictionary mapping contract/module names to ContractInfo
@@ -140,21 +255,36 @@ class CairoParser:
         if file_key in self.parsed_files:
             return self.parsed_files[file_key]
 
-        # Read source code
-        source_code = file_path.read_text()
+        contracts, imports = self._parse_single_file(file_path, file_key)
 
-        # Detect Cairo version
-        cairo_version = self._detect_cairo_version(source_code)
+        # Second pass: Try to resolve imports (lazy linking)
+        if stub_missing:
+            self._resolve_imports_lazy(imports, file_path)
 
-        # First pass: Extract imports
-        imports = self._extract_imports(source_code, cairo_version)
+        self._attach_imports(contracts, imports)
+        return contracts
 
-        # Parse the file (regex parsing works for both Cairo 0 and 1)
-        contracts = self._parse_cairo1_regex(source_code, file_path)
+    def _parse_single_file(
+        self,
+        file_path: Path,
+        file_key: str
+    ) -> Tuple[Dict[str, ContractInfo], List[ImportInfo]]:
+        """
+        Parse a file for parse_file() and register its contracts.
+
+        Args:
+            file_path: Path to Cairo file
+            file_key: Resolved path used as the parsed_files key
+
+        Returns:
+            Tuple of (contracts, imports)
+        """
+        imports, contracts = self._parse_source_file(file_path)
 
         # Register symbols in global registry (GOT-style)
+        file_stem = file_path.stem
         for contract_name, contract in contracts.items():
-            symbol_key = f"{file_path.stem}::{contract_name}"
+            symbol_key = f"{file_stem}::{contract_name}"
             self.symbol_registry[symbol_key] = contract
             # Also register by contract name alone
             self.symbol_registry[contract_name] = contract
@@ -162,16 +292,15 @@ class CairoParser:
         # Cache parsed result
         self.parsed_files[file_key] = contracts
 
-        # Second pass: Try to resolve imports (lazy linking)
-        if stub_missing:
-            self._resolve_imports_recursive(imports, file_path)
+        return contracts, imports
 
-        # Add import information to contracts
+    def _attach_imports(self, contracts: Dict[str, ContractInfo], imports: List[ImportInfo]):
+        """Add import information to contracts once their imports are resolved."""
+        # They all share one copy of the stubs known at this point
+        stub_modules = self.stub_registry.copy()
         for contract in contracts.values():
             contract.imports = imports
-            contract.stub_modules = self.stub_registry.copy()
-
-        return contracts
+            contract.stub_modules = stub_modules
 
     def parse_directories(self, directories: List[Path], stub_missing: bool = True) -> Dict[str, ContractInfo]:
         """
@@ -181,6 +310,10 @@ class CairoParser:
         Pass 2: Resolve imports from symbol table (like assembler linking)
         Pass 3: Stub anything not found (external dependencies)
 
+        On multi-core machines, Pass 1 parses batches of PARALLEL_THRESHOLD or
+        more files in worker processes. On platforms that spawn workers, call
+        this from under an ``if __name__ == '__main__':`` guard.
+
         Args:
             directories: List of directories containing Cairo files
             stub_missing: If True, create stubs for unresolved symbols
@@ -203,33 +336,49 @@ class CairoParser:
 
         # PASS 1: Parse all files and build symbol table
         print(f"[Pass 1/3] Parsing {len(cairo_files)} files from {len(directories)} director{'y' if len(directories)==1 else 'ies'}...")
-        for cairo_file in cairo_files:
-            try:
-                self._parse_and_register(cairo_file)
-            except Exception as e:
-                print(f"Warning: Failed to parse {cairo_file}: {e}")
+        if len(cairo_files) < self.PARALLEL_THRESHOLD or (os.cpu_count() or 1) < 2:
+            for cairo_file in cairo_files:
+                try:
+                    self._parse_and_register(cairo_file)
+                except Exception as e:
+                    print(f"Warning: Failed to parse {cairo_file}: {e}")
+        else:
+            # Files are parsed in worker processes, then registered here in
+            # the original order so the symbol table comes out the same
+            with ProcessPoolExecutor() as executor:
+                results = executor.map(
+                    _parse_file_worker, cairo_files, repeat(self.extract_bodies), chunksize=16
+                )
+                for cairo_file, (file_key, parsed) in zip(cairo_files, results):
+                    if isinstance(parsed, Exception):
+                        print(f"Warning: Failed to parse {cairo_file}: {parsed}")
+                    elif file_key not in self.parsed_files:
+                        self._register_file(cairo_file, file_key, *parsed)
 
         print(f"[Pass 1/3] Symbol table built: {len(self.symbol_registry)} symbols")
 
         # PASS 2: Resolve all imports from symbol table
-        print(f"[Pass 2/3] Resolving imports from symbol table...")
-        for file_path, contracts in self.parsed_files.items():
-            for contract in contracts.values():
-                self._resolve_imports_from_symbol_table(contract.imports)
-
         # PASS 3: Create stubs for unresolved external dependencies
+        # Stubs never affect resolution, so both passes share one walk over
+        # the imports
+        print(f"[Pass 2/3] Resolving imports from symbol table...")
         if stub_missing:
             print(f"[Pass 3/3] Creating stubs for external dependencies...")
-            self._create_stubs_for_unresolved()
+        for contracts in self.parsed_files.values():
+            for contract in contracts.values():
+                self._resolve_imports_from_symbol_table(contract.imports)
+                if stub_missing:
+                    self._create_stubs_for_unresolved(contract.imports)
 
         # Collect all contracts
         all_contracts = {}
         for contracts in self.parsed_files.values():
             all_contracts.update(contracts)
 
-        # Update stub information in each contract
+        # Update stub information in each contract, sharing a single copy
+        stub_modules = self.stub_registry.copy()
         for contract in all_contracts.values():
-            contract.stub_modules = self.stub_registry.copy()
+            contract.stub_modules = stub_modules
 
         resolved = len(self.resolved_imports)
         stubbed = len(self.stub_registry)
@@ -241,17 +390,46 @@ class CairoParser:
         """Find all .cairo files in directories, excluding tests."""
         cairo_files = []
         for directory in directories:
-            for cairo_file in directory.rglob('*.cairo'):
-                # Skip test files
-                name = cairo_file.name
-                parts = cairo_file.parts
+            # Everything under a test directory is skipped, including the
+            # requested directory itself
+            if 'tests' in directory.parts or 'test' in directory.parts:
+                continue
 
-                if name.startswith('test_') or name.endswith('_test.cairo') or name == 'tests.cairo':
-                    continue
-                if 'tests' in parts or 'test' in parts:
+            # Depth-first, listing each directory's files before its
+            # subdirectories (the order rglob yields them in); test
+            # directories are never entered
+            stack = [str(directory)]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as it:
+                        entries = list(it)
+                except OSError:
                     continue
 
-                cairo_files.append(cairo_file)
+                subdirs = []
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        # Like rglob, don't follow symlinked directories
+                        if name != 'tests' and name != 'test' and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+
+                    if not name.endswith('.cairo'):
+                        continue
+
+                    # Skip test files
+                    if name.startswith('test_') or name.endswith('_test.cairo') or name == 'tests.cairo':
+                        continue
+
+                    cairo_files.append(Path(entry.path))
+
+                stack.extend(reversed(subdirs))
 
         return cairo_files
 
@@ -262,8 +440,21 @@ class CairoParser:
         if file_key in self.parsed_files:
             return
 
+        imports, contracts = self._parse_source_file(file_path)
+        self._register_file(file_path, file_key, imports, contracts)
+
+    def _parse_source_file(self, file_path: Path) -> Tuple[List[ImportInfo], Dict[str, ContractInfo]]:
+        """
+        Read and parse a file without touching the registries.
+
+        Args:
+            file_path: Path to Cairo file
+
+        Returns:
+            Tuple of (imports, contracts)
+        """
         # Read and parse
-        source_code = file_path.read_text()
+        source_code = _read_source(file_path)
         cairo_version = self._detect_cairo_version(source_code)
 
         # Extract imports first
@@ -272,13 +463,36 @@ class CairoParser:
         # Parse (regex parsing works for both Cairo 0 and 1)
         contracts = self._parse_cairo1_regex(source_code, file_path)
 
-        # Compute module path relative to src/
+        return imports, contracts
+
+    def _register_file(
+        self,
+        file_path: Path,
+        file_key: str,
+        imports: List[ImportInfo],
+        contracts: Dict[str, ContractInfo]
+    ):
+        """
+        Register a parsed file's module and symbols in the symbol table.
+
+        Args:
+            file_path: Path to Cairo file
+            file_key: Resolved path, the key in parsed_files
+            imports: Imports extracted from the file
+            contracts: Contracts parsed from the file
+        """
+        # Compute module path relative to src/; the name prefixes are built
+        # once per file rather than per registered symbol
         module_path = self._compute_module_path(file_path)
+        file_stem = sys.intern(file_path.stem)
+        file_prefix = f"{file_stem}::"
+        module_prefix = None
 
         # Register the module path itself (even if no contracts)
         # This allows imports like "crate::components::upgradeable" to resolve
         if module_path:
-            file_stem = file_path.stem
+            module_path = sys.intern(module_path)
+            module_prefix = f"{module_path}::"
             # Create a placeholder "module" entry
             module_info = ContractInfo(
                 name=file_stem,
@@ -299,26 +513,24 @@ class CairoParser:
             self.symbol_registry[file_stem] = module_info
 
         # Register symbols in GOT
+        registry = self.symbol_registry
         for contract_name, contract in contracts.items():
             # Register by simple file name
-            file_stem = file_path.stem
-            self.symbol_registry[f"{file_stem}::{contract_name}"] = contract
-            self.symbol_registry[contract_name] = contract
+            registry[file_prefix + contract_name] = contract
+            registry[contract_name] = contract
 
             # Register by module path (e.g., components::upgradeable)
-            if module_path:
-                self.symbol_registry[f"{module_path}::{contract_name}"] = contract
-                self.symbol_registry[module_path] = contract
+            if module_prefix:
+                registry[module_prefix + contract_name] = contract
+                registry[module_path] = contract
 
-            # Register all functions as symbols
+            # Register all functions as symbols, qualified and bare
             for func in contract.functions:
-                self.symbol_registry[f"{file_stem}::{func.name}"] = contract
-                if module_path:
-                    self.symbol_registry[f"{module_path}::{func.name}"] = contract
-
-            # Register imported symbols
-            for symbol in contract.functions:
-                self.symbol_registry[symbol.name] = contract
+                name = func.name
+                registry[file_prefix + name] = contract
+                if module_prefix:
+                    registry[module_prefix + name] = contract
+                registry[name] = contract
 
             # Store imports for later resolution
             contract.imports = imports
@@ -335,22 +547,24 @@ class CairoParser:
           -> components::upgradeable
         """
         # Find src/ in the path
-        parts = list(file_path.parts)
+        parts = file_path.parts
 
         try:
             src_index = parts.index('src')
-            # Get parts after src/
-            module_parts = parts[src_index + 1:]
-            # Remove .cairo extension from last part
-            if module_parts:
-                module_parts[-1] = Path(module_parts[-1]).stem
-            # Join with ::
-            return '::'.join(module_parts)
-        except (ValueError, IndexError):
+        except ValueError:
             return None
 
+        # Directories between src/ and the file, then the file name without
+        # its .cairo extension (the last part is the file's own name)
+        if src_index + 1 == len(parts):
+            return ''
+        return '::'.join(parts[src_index + 1:-1] + (file_path.stem,))
+
     def _resolve_imports_from_symbol_table(self, imports: List[ImportInfo]):
         """Resolve imports by looking up symbol table (Pass 2)."""
+        # Live, set-like view of the registered names
+        registry_symbols = self.symbol_registry.keys()
+
         for imp in imports:
             # Skip already resolved
             if imp.resolved:
@@ -370,14 +584,13 @@ class CairoParser:
                 found = True
                 continue
 
-            # Try each imported symbol
-            for symbol in imp.symbols:
-                if symbol in self.symbol_registry:
-                    imp.resolved = True
-                    imp.stub_created = False
-                    self.resolved_imports[module_path] = "<symbol_table>"
-                    found = True
-                    break
+            # Try the imported symbols, all in one set operation
+            if not registry_symbols.isdisjoint(imp.symbols):
+                imp.resolved = True
+                imp.stub_created = False
+                self.resolved_imports[module_path] = "<symbol_table>"
+                found = True
+                continue
 
             # Try stripping 'crate::' prefix and matching
             if module_path.startswith('crate::'):
@@ -389,31 +602,31 @@ class CairoParser:
                     found = True
                     continue
 
-                # Try matching individual path components
-                parts = stripped.split('::')
-                for i in range(len(parts)):
-                    partial = '::'.join(parts[:i+1])
-                    if partial in self.symbol_registry:
+                # Try matching leading path components (a, a::b, ...), sliced
+                # off at each separator rather than re-joined from the parts
+                end = stripped.find('::')
+                while end != -1:
+                    if stripped[:end] in self.symbol_registry:
                         imp.resolved = True
                         imp.stub_created = False
                         self.resolved_imports[module_path] = "<symbol_table>"
                         found = True
                         break
+                    end = stripped.find('::', end + 2)
 
-    def _create_stubs_for_unresolved(self):
-        """Create stubs for all unresolved imports (Pass 3)."""
-        # Collect all unresolved imports from all parsed files
-        unresolved = set()
+    def _create_stubs_for_unresolved(self, imports: List[ImportInfo]):
+        """Create stubs for unresolved imports that have none yet (Pass 3)."""
+        stub_registry = self.stub_registry
 
-        for contracts in self.parsed_files.values():
-            for contract in contracts.values():
-                for imp in contract.imports:
-                    if not imp.resolved and imp.module_path not in self.stub_registry:
-                        unresolved.add(imp.module_path)
-                        # Create stub
-                        stub = self._create_stub_module(imp)
-                        self.stub_registry[imp.module_path] = stub
-                        imp.stub_created = True
+        for imp in imports:
+            if imp.resolved:
+                continue
+
+            module_path = imp.module_path
+            if stub_registry.get(module_path) is None:
+                # Create stub
+                stub_registry[module_path] = self._create_stub_module(imp)
+                imp.stub_created = True
 
     def _detect_cairo_version(self, source_code: str) -> int:
         """
@@ -434,23 +647,14 @@ class CairoParser:
             0 for Cairo 0, 1 for Cairo 1
         """
         # Strong Cairo 1 indicators
-        if any(pattern in source_code for pattern in [
-            '#[starknet::contract]',
-            '#[starknet::interface]',
-            '#[storage]',
-            'felt252',
-            'fn ',
-        ]):
-            return 1
+        for marker in _CAIRO1_MARKERS:
+            if marker in source_code:
+                return 1
 
         # Strong Cairo 0 indicators
-        if any(pattern in source_code for pattern in [
-            '@storage_var',
-            '@external',
-            '@view',
-            'func ',
-        ]):
-            return 0
+        for marker in _CAIRO0_MARKERS:
+            if marker in source_code:
+                return 0
 
         # Default to Cairo 1 (modern)
         return 1
@@ -466,114 +670,150 @@ class CairoParser:
 
         if cairo_version == 0:
             # Cairo 0: from module import Item
-            pattern = r'from\s+([\w.]+)\s+import\s+([^\n]+)'
-            for match in re.finditer(pattern, source_code):
-                module_path = match.group(1)
+            # Matches come in order, so line numbers are kept by counting
+            # only the newlines since the previous match
+            line = 1
+            pos = 0
+            for match in _CAIRO0_IMPORT_RE.finditer(source_code):
+                start = match.start()
+                line += source_code.count('\n', pos, start)
+                pos = start
+
+                module_path = sys.intern(match.group(1))
                 symbols_str = match.group(2).strip()
                 # Handle "import *" or "import Item1, Item2"
                 if symbols_str == '*':
                     symbols = []
                 else:
-                    symbols = [s.strip() for s in symbols_str.split(',')]
+                    symbols = [sys.intern(s.strip()) for s in symbols_str.split(',')]
 
                 imports.append(ImportInfo(
                     module_path=module_path,
                     symbols=symbols,
-                    line=source_code[:match.start()].count('\n') + 1
+                    line=line
                 ))
         else:
             # Cairo 1: use module::{Item1, Item2};
-            import_patterns = [
-                r'use\s+([\w:]+)::\{([^}]+)\};',  # use module::{Item1, Item2};
-                r'use\s+([\w:]+);',                 # use module::Item; or use module;
-            ]
-
-            for line_num, line in enumerate(source_code.split('\n'), 1):
-                line = line.strip()
-                if not line.startswith('use '):
+            # One scan over the whole source; line numbers are counted as
+            # for Cairo 0
+            line = 1
+            pos = 0
+            for match in _USE_RE.finditer(source_code):
+                start = match.start()
+
+                # Only whitespace may come before 'use' on its line
+                line_start = source_code.rfind('\n', 0, start) + 1
+                if line_start != start and not source_code[line_start:start].isspace():
                     continue
 
-                # Try pattern with braces first
-                match = re.match(import_patterns[0], line)
-                if match:
-                    module_path = match.group(1)
-                    symbols = [s.strip() for s in match.group(2).split(',')]
-                    imports.append(ImportInfo(
-                        module_path=module_path,
-                        symbols=symbols,
-                        line=line_num
-                    ))
-                    continue
+                line += source_code.count('\n', pos, start)
+                pos = start
 
-                # Try simple import
-                match = re.match(import_patterns[1], line)
-                if match:
-                    module_path = match.group(1)
+                module_path, items = match.groups()
+                if items is not None:
+                    symbols = [sys.intern(s.strip()) for s in items.split(',')]
+                else:
                     # Check if last component looks like a type/function
                     parts = module_path.split('::')
                     if len(parts) > 1 and parts[-1][0].isupper():
                         # Likely importing specific item
-                        symbols = [parts[-1]]
+                        symbols = [sys.intern(parts[-1])]
                         module_path = '::'.join(parts[:-1])
                     else:
                         # Importing whole module
                         symbols = []
 
-                    imports.append(ImportInfo(
-                        module_path=module_path,
-                        symbols=symbols,
-                        line=line_num
-                    ))
+                imports.append(ImportInfo(
+                    module_path=sys.intern(module_path),
+                    symbols=symbols,
+                    line=line
+                ))
 
         return imports
 
-    def _resolve_imports_recursive(self, imports: List[ImportInfo], base_path: Path):
+    def _resolve_imports_lazy(self, imports: List[ImportInfo], base_path: Path):
         """
-        Resolve imports recursively using GOT/PLT-style lazy linking.
+        Resolve imports using GOT/PLT-style lazy linking.
 
         Process:
         1. For each import, try to find the source file
-        2. If found, recursively parse it (adds to symbol registry)
+        2. If found, parse it (adds to symbol registry) and resolve its own
+           imports before moving on to the next one
         3. If not found, create PLT-style stub
         4. After all files parsed, resolve stubs from symbol registry (GOT lookup)
-        """
-        base_dir = base_path.parent
 
-        for imp in imports:
-            # Check if already resolved
-            if imp.module_path in self.resolved_imports:
-                imp.resolved = True
-                imp.stub_created = False
-                continue
+        Imported files are walked depth-first on an explicit stack rather than
+        by re-entering parse_file(), so long import chains cannot exhaust the
+        interpreter's recursion limit. Each frame holds the remaining imports
+        of one file, the directory they are relative to, that file's imports
+        and contracts, and the import (with its module file) in the parent
+        frame that it will resolve.
+        """
+        stack = [[iter(imports), base_path.parent, imports, None, None, None]]
 
-            # Try to find the source file
-            module_file = self._find_module_file(imp.module_path, base_dir)
+        while stack:
+            frame = stack[-1]
+            pending, base_dir = frame[0], frame[1]
+            try:
+                for imp in pending:
+                    # Check if already resolved
+                    if imp.module_path in self.resolved_imports:
+                        imp.resolved = True
+                        imp.stub_created = False
+                        continue
+
+                    # Try to find the source file
+                    module_file = self._find_module_file(imp.module_path, base_dir)
+
+                    if module_file and module_file.exists():
+                        # Found the file - parse it (lazy linking)
+                        try:
+                            file_key = str(module_file.resolve())
+                            if file_key not in self.parsed_files:
+                                contracts, module_imports = self._parse_single_file(module_file, file_key)
+                                # Descend into the imported file's own imports
+                                stack.append([
+                                    iter(module_imports), module_file.parent,
+                                    module_imports, contracts, imp, module_file
+                                ])
+                                break
+                            imp.resolved = True
+                            imp.stub_created = False
+                            self.resolved_imports[imp.module_path] = str(module_file)
+                        except Exception:
+                            # If parsing fails, create stub
+                            self._stub_import(imp)
+                    else:
+                        # File not found - check if symbol exists in registry (GOT lookup)
+                        symbol_found = self._try_resolve_from_registry(imp)
 
-            if module_file and module_file.exists():
-                # Found the file - recursively parse it (lazy linking)
-                try:
-                    self.parse_file(module_file, stub_missing=True, _recursive=True)
-                    imp.resolved = True
-                    imp.stub_created = False
-                    self.resolved_imports[imp.module_path] = str(module_file)
-                except Exception as e:
-                    # If parsing fails, create stub
-                    imp.resolved = False
-                    imp.stub_created = True
-                    if imp.module_path not in self.stub_registry:
-                        stub = self._create_stub_module(imp)
-                        self.stub_registry[imp.module_path] = stub
-            else:
-                # File not found - check if symbol exists in registry (GOT lookup)
-                symbol_found = self._try_resolve_from_registry(imp)
-
-                if not symbol_found:
-                    # Create PLT-style stub for unresolved import
-                    imp.resolved = False
-                    imp.stub_created = True
-                    if imp.module_path not in self.stub_registry:
-                        stub = self._create_stub_module(imp)
-                        self.stub_registry[imp.module_path] = stub
+                        if not symbol_found:
+                            # Create PLT-style stub for unresolved import
+                            self._stub_import(imp)
+                else:
+                    # All imports of this file handled
+                    _, _, module_imports, contracts, imp, module_file = frame
+                    if imp is not None:
+                        self._attach_imports(contracts, module_imports)
+                        imp.resolved = True
+                        imp.stub_created = False
+                        self.resolved_imports[imp.module_path] = str(module_file)
+                    stack.pop()
+            except Exception:
+                # Errors while linking an imported file stub the import that
+                # pulled it in; errors in the file being parsed propagate
+                if frame[4] is None:
+                    raise
+                stack.pop()
+                self._stub_import(frame[4])
+
+    def _stub_import(self, imp: ImportInfo):
+        """Mark an import as unresolved and create its PLT-style stub."""
+        imp.resolved = False
+        imp.stub_created = True
+        if imp.module_path not in self.stub_registry:
+            stub = self._create_stub_module(imp)
+            self.stub_registry[imp.module_path] = stub
 
     def _try_resolve_from_registry(self, import_info: ImportInfo) -> bool:
         """
@@ -588,12 +828,12 @@ class CairoParser:
             import_info.stub_created = False
             return True
 
-        # Try matching imported symbols
-        for symbol in import_info.symbols:
-            if symbol in self.symbol_registry:
-                import_info.resolved = True
-                import_info.stub_created = False
-                return True
+        # Try matching imported symbols; the live keys view checks them all
+        # in one set operation
+        if not self.symbol_registry.keys().isdisjoint(import_info.symbols):
+            import_info.resolved = True
+            import_info.stub_created = False
+            return True
 
         return False
 
@@ -609,16 +849,23 @@ class CairoParser:
         """
         parts = module_path.split('::')
 
+        # crate:: paths are relative to the project root (directory containing src/)
+        is_crate = parts[0] == 'crate'
+        search_root = self._find_project_root(base_dir) if is_crate else base_dir
+
+        # The same module imported from the same root always maps to the same
+        # file, so results (misses included) are memoized
+        key = (module_path, search_root)
+        try:
+            return self._module_file_cache[key]
+        except KeyError:
+            pass
+
         # Handle crate:: prefix (relative to project root)
-        if parts[0] == 'crate':
+        if is_crate:
             # Remove 'crate' prefix
             parts = parts[1:]
-            # Find project root (directory containing src/)
-            project_root = base_dir
-            while project_root.parent != project_root:
-                if (project_root / 'src').exists():
-                    break
-                project_root = project_root.parent
+            project_root = search_root
 
             # Try different possible file locations from project root
             # First try exact path
@@ -651,11 +898,38 @@ class CairoParser:
                     base_dir / Path('/'.join(parent_parts)).with_suffix('.cairo'),
                 ])
 
+        module_file = None
         for candidate in candidates:
             if candidate.exists():
-                return candidate
+                module_file = candidate
+                break
+
+        self._module_file_cache[key] = module_file
+        return module_file
+
+    def _find_project_root(self, base_dir: Path) -> Path:
+        """
+        Find the project root (nearest directory containing src/) above base_dir.
+
+        Args:
+            base_dir: Directory of the importing file
+
+        Returns:
+            Project root, or the filesystem root if no src/ directory is found
+        """
+        try:
+            return self._project_roots[base_dir]
+        except KeyError:
+            pass
+
+        project_root = base_dir
+        while project_root.parent != project_root:
+            if (project_root / 'src').exists():
+                break
+            project_root = project_root.parent
 
-        return None
+        self._project_roots[base_dir] = project_root
+        return project_root
 
     def _create_stub_module(self, import_info: ImportInfo) -> ContractInfo:
         """
@@ -699,91 +973,114 @@ class CairoParser:
         """
         contracts = {}
         current_contract = None
-        in_contract_decorator = False
+
+        # Attributes waiting for the line they apply to, as
+        # (contract type or contract, last line to look at):
+        # the mod after a contract attribute (within 5 lines), the struct
+        # after #[storage] (within 50) and the enum/struct after #[event] (within 10)
+        pending_mod = None
+        pending_storage = None
+        pending_event = None
+
+        # Storage struct being read (contract, last line), and its brace depth
+        storage = None
+        storage_braces = 0
 
         lines = source_code.split('\n')
 
         for line_num, line in enumerate(lines, 1):
             stripped = line.strip()
 
+            # Lines awaited by earlier attributes are handled first, since a
+            # mod line opens the contract that the rest of the line belongs to
+            if pending_mod is not None:
+                contract_type, last_line = pending_mod
+                if line_num > last_line:
+                    pending_mod = None
+                elif 'mod ' in stripped:
+                    # Match: mod Name, pub mod Name, etc.
+                    match = _MOD_RE.search(stripped)
+                    if match:
+                        contract_name = sys.intern(match.group(1))
+                        current_contract = ContractInfo(
+                            name=contract_name,
+                            file_path=str(file_path),
+                            contract_type=contract_type
+                        )
+                        contracts[contract_name] = current_contract
+                        pending_mod = None
+
+            if pending_storage is not None:
+                contract, last_line = pending_storage
+                if line_num > last_line:
+                    pending_storage = None
+                elif 'struct Storage' in stripped:
+                    # Storage variables are read from up to 100 lines
+                    storage = (contract, line_num + 99)
+                    storage_braces = 0
+                    pending_storage = None
+
+            if storage is not None:
+                contract, last_line = storage
+                if line_num > last_line:
+                    storage = None
+                else:
+                    storage_braces += stripped.count('{') - stripped.count('}')
+
+                    # Parse storage variable: name: Type
+                    if ':' in stripped and storage_braces > 0:
+                        var_match = _STORAGE_VAR_RE.match(stripped)
+                        if var_match:
+                            var_name = sys.intern(var_match.group(1))
+                            var_type = sys.intern(var_match.group(2).strip().rstrip(','))
+                            contract.storage_vars.append(StorageVarInfo(
+                                name=var_name,
+                                var_type=var_type,
+                                line=line_num
+                            ))
+
+                    if storage_braces == 0 and '}' in stripped:
+                        storage = None
+
+            if pending_event is not None:
+                contract, last_line = pending_event
+                if line_num > last_line:
+                    pending_event = None
+                elif stripped.startswith(_EVENT_PREFIXES):
+                    event_info = self._parse_event(stripped, line_num)
+                    if event_info:
+                        contract.events.append(event_info)
+                    pending_event = None
+
             # Contract/interface/module declaration
             if '#[starknet::contract]' in stripped or '#[starknet::interface]' in stripped:
-                in_contract_decorator = True
                 contract_type = 'interface' if 'interface' in stripped else 'contract'
-
-                # Look for mod declaration in next few lines
-                for next_line_num in range(line_num, min(line_num + 5, len(lines))):
-                    next_line = lines[next_line_num].strip()
-                    # Match: mod Name, pub mod Name, etc.
-                    if 'mod ' in next_line:
-                        match = re.search(r'mod\s+(\w+)', next_line)
-                        if match:
-                            contract_name = match.group(1)
-                            current_contract = ContractInfo(
-                                name=contract_name,
-                                file_path=str(file_path),
-                                contract_type=contract_type
-                            )
-                            contracts[contract_name] = current_contract
-                            in_contract_decorator = False
-                            break
+                # The contract starts at the mod declaration that follows
+                pending_mod = (contract_type, line_num + 5)
 
             # Storage struct
             elif current_contract and '#[storage]' in stripped:
                 # Storage variables follow in next struct
-                for next_line_num in range(line_num, min(line_num + 50, len(lines))):
-                    next_line = lines[next_line_num].strip()
-
-                    # Find struct Storage
-                    if 'struct Storage' in next_line:
-                        # Parse storage variables inside
-                        brace_count = 0
-                        for storage_line_num in range(next_line_num, min(next_line_num + 100, len(lines))):
-                            storage_line = lines[storage_line_num].strip()
-
-                            if '{' in storage_line:
-                                brace_count += storage_line.count('{')
-                            if '}' in storage_line:
-                                brace_count -= storage_line.count('}')
-
-                            # Parse storage variable: name: Type
-                            if ':' in storage_line and brace_count > 0:
-                                var_match = re.match(r'(\w+)\s*:\s*([^,]+)', storage_line)
-                                if var_match:
-                                    var_name = var_match.group(1)
-                                    var_type = var_match.group(2).strip().rstrip(',')
-                                    current_contract.storage_vars.append(StorageVarInfo(
-                                        name=var_name,
-                                        var_type=var_type,
-                                        line=storage_line_num + 1
-                                    ))
-
-                            if brace_count == 0 and '}' in storage_line:
-                                break
-                        break
+                pending_storage = (current_contract, line_num + 50)
 
             # Functions (more robust matching)
             elif current_contract and 'fn ' in stripped:
                 func_info = self._parse_function(stripped, line_num)
                 if func_info:
-                    # Extract function body for control flow analysis
-                    body_text, body_start, body_end = self._extract_function_body(lines, line_num)
-                    if body_text is not None:
-                        func_info.body_text = body_text
-                        func_info.body_start_line = body_start
-                        func_info.body_end_line = body_end
+                    # Extract function body for control flow analysis, unless
+                    # this is a bodiless declaration (fn name(...) -> T;)
+                    if self.extract_bodies and ('{' in stripped or not stripped.endswith(';')):
+                        body_text, body_start, body_end = self._extract_function_body(lines, line_num)
+                        if body_text is not None:
+                            func_info.body_text = body_text
+                            func_info.body_start_line = body_start
+                            func_info.body_end_line = body_end
                     current_contract.functions.append(func_info)
 
             # Events
             elif current_contract and '#[event]' in stripped:
                 # Event follows
-                for next_line_num in range(line_num, min(line_num + 10, len(lines))):
-                    next_line = lines[next_line_num].strip()
-                    if next_line.startswith('enum ') or next_line.startswith('struct '):
-                        event_info = self._parse_event(next_line, next_line_num + 1)
-                        if event_info:
-                            current_contract.events.append(event_info)
-                        break
+                pending_event = (current_contract, line_num + 10)
 
         return contracts
 
@@ -803,7 +1100,6 @@ class CairoParser:
             return None, None, None
 
         brace_count = 0
-        body_lines = []
         body_start = None
         body_end = None
         found_opening_brace = False
@@ -812,19 +1108,12 @@ class CairoParser:
         for i in range(start_line - 1, len(source_lines)):
             line = source_lines[i]
 
-            # Track braces
-            for char in line:
-                if char == '{':
-                    if not found_opening_brace:
-                        found_opening_brace = True
-                        body_start = i + 1  # 1-indexed
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-
-            # Collect body lines after finding opening brace
-            if found_opening_brace:
-                body_lines.append(line)
+            # Track braces; only the net count at the end of each line matters
+            opens = line.count('{')
+            if opens and not found_opening_brace:
+                found_opening_brace = True
+                body_start = i + 1  # 1-indexed
+            brace_count += opens - line.count('}')
 
             # Check if we've closed the function body
             if found_opening_brace and brace_count == 0:
@@ -835,8 +1124,9 @@ class CairoParser:
         if not found_opening_brace or body_end is None:
             return None, None, None
 
-        # Join the body lines
-        body_text = '\n'.join(body_lines)
+        # The body is the contiguous run of lines from the opening brace
+        # to the closing one
+        body_text = '\n'.join(source_lines[body_start - 1:body_end])
 
         return body_text, body_start, body_end
 
@@ -844,17 +1134,28 @@ class CairoParser:
         """Parse a Cairo function declaration."""
         # Pattern: fn function_name(params) -> return_type
         # Handle multi-line params by just looking for fn NAME
-        match = re.search(r'fn\s+(\w+)', line)
+        match = _FN_RE.search(line)
         if not match:
             return None
 
-        func_name = match.group(1)
-
-        # Try to extract params and return type (might span multiple lines)
-        params_match = re.search(r'\(([^)]*)\)', line)
-        params_str = params_match.group(1) if params_match else ""
-
-        returns_match = re.search(r'->\s*([^{;]+)', line)
+        func_name = sys.intern(match.group(1))
+
+        # Try to extract params and return type (might span multiple lines).
+        # Both follow the name, so an attribute earlier on the line such as
+        # #[external(v0)] is not mistaken for the parameter list
+        # The return type is looked for after the closing parenthesis, so the
+        # '->' of a function-typed parameter is not taken for it
+        name_end = match.end()
+        param_strs = []
+        returns_start = name_end
+        params_open = line.find('(', name_end)
+        if params_open != -1:
+            split = _split_parameters(line, params_open + 1)
+            if split is not None:
+                param_strs, close_paren = split
+                returns_start = close_paren + 1
+
+        returns_match = _FN_RETURNS_RE.search(line, returns_start) if '->' in line else None
         returns_str = returns_match.group(1) if returns_match else None
 
         # Determine visibility from context
@@ -874,23 +1175,21 @@ class CairoParser:
 
         # Parse parameters
         parameters = []
-        if params_str.strip():
-            for param in params_str.split(','):
-                param = param.strip()
-                if ':' in param:
-                    # Handle ref/mut modifiers
-                    param = param.replace('ref ', '').replace('mut ', '')
-                    param_parts = param.split(':', 1)
-                    if len(param_parts) == 2:
-                        parameters.append({
-                            'name': param_parts[0].strip(),
-                            'type': param_parts[1].strip()
-                        })
+        for param in param_strs:
+            if ':' in param:
+                # Handle ref/mut modifiers
+                if 'ref ' in param or 'mut ' in param:
+                    param = param.strip().replace('ref ', '').replace('mut ', '')
+                param_name, _, param_type = param.partition(':')
+                parameters.append({
+                    'name': sys.intern(param_name.strip()),
+                    'type': sys.intern(param_type.strip())
+                })
 
         # Parse return type
         returns = []
         if returns_str:
-            returns.append({'type': returns_str.strip()})
+            returns.append({'type': sys.intern(returns_str.strip())})
 
         return FunctionInfo(
             name=func_name,
@@ -904,7 +1203,7 @@ class CairoParser:
     def _parse_event(self, line: str, line_num: int) -> Optional[EventInfo]:
         """Parse a Cairo event declaration."""
         # Pattern: struct EventName or enum EventName
-        match = re.match(r'(?:struct|enum)\s+(\w+)', line)
+        match = _EVENT_RE.match(line)
         if not match:
             return None
 
@@ -927,8 +1226,8 @@ class CairoParser:
             'total_stubs': len(self.stub_registry),
             'total_resolved': len(self.resolved_imports),
             'total_symbols': len(self.symbol_registry),
-            'stubbed_modules': list(self.stub_registry.keys()),
-            'resolved_modules': list(self.resolved_imports.keys()),
+            'stubbed_modules': list(self.stub_registry),
+            'resolved_modules': list(self.resolved_imports),
             'stubs': {
                 name: {
                     'file_path': stub.file_path,
@@ -937,8 +1236,23 @@ class CairoParser:
                 }
                 for name, stub in self.stub_registry.items()
             },
-            'resolved': {
-                module: file_path
-                for module, file_path in self.resolved_imports.items()
-            }
+            'resolved': dict(self.resolved_imports)
         }
+
+
+def _parse_file_worker(file_path: Path, extract_bodies: bool = True) -> Tuple[Optional[str], Any]:
+    """
+    Parse one file for Pass 1 of CairoParser.parse_directories in a worker process.
+
+    Args:
+        file_path: Path to Cairo file
+        extract_bodies: Passed on to CairoParser
+
+    Returns:
+        Tuple of (resolved path, (imports, contracts)), or (None, exception)
+        if the file could not be read or parsed
+    """
+    try:
+        return str(file_path.resolve()), CairoParser(extract_bodies)._parse_source_file(file_path)
+    except Exception as e:
+        return None, e
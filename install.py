@@ -6,6 +6,7 @@ Provides structured Cairo code parsing with stubbing for missing dependencies.
 
 import subprocess
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
 TOOL_INFO = {
@@ -22,6 +23,7 @@ DEPENDENCIES = {
     "required": [],
     "optional": {
         "pyyaml": "YAML output format",
+        "orjson": "Faster JSON output",
     }
 }
 
@@ -43,22 +45,39 @@ def install(install_dir: Path = None) -> bool:
 
     try:
 
-        # Install optional dependencies
-        for package, feature in DEPENDENCIES["optional"].items():
-            try:
-                subprocess.run(
-                    [sys.executable, '-m', 'pip', 'install', package],
-                    check=True,
-                    capture_output=True
-                )
+        # Install optional dependencies, all in one pip run
+        optional = DEPENDENCIES["optional"]
+        batch = subprocess.run(
+            [sys.executable, '-m', 'pip', 'install', *optional],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        if batch.returncode == 0:
+            for package, feature in optional.items():
                 print(f"[cairo-parser] ✓ Installed {package} ({feature})")
-            except subprocess.CalledProcessError:
-                print(f"[cairo-parser] ⚠ Optional: {package} ({feature})")
+        else:
+            # Retry one at a time to find out which packages failed
+            for package, feature in optional.items():
+                try:
+                    subprocess.run(
+                        [sys.executable, '-m', 'pip', 'install', package],
+                        check=True,
+                        capture_output=True
+                    )
+                    print(f"[cairo-parser] ✓ Installed {package} ({feature})")
+                except subprocess.CalledProcessError:
+                    print(f"[cairo-parser] ⚠ Optional: {package} ({feature})")
 
         print(f"[cairo-parser] Installation complete")
 
         return True
 
+    except OSError as e:
+        # pip could not be started at all; the message says why
+        print(f"[cairo-parser] Installation failed: {e}")
+        return False
+
     except Exception as e:
         print(f"[cairo-parser] Installation failed: {e}")
         import traceback
@@ -79,23 +98,49 @@ def check() -> dict:
         "yaml_support": False,
     }
 
+    # Probes locate the modules without running them; for cairo-lang only
+    # the parent packages are imported, and a missing one raises ImportError
+
     # Check cairo-lang support (for Cairo 0 AST parsing)
     try:
-        import starkware.cairo.lang.compiler.parser
-        status["cairo_lang"] = True
+        status["cairo_lang"] = find_spec("starkware.cairo.lang.compiler.parser") is not None
     except ImportError:
         pass
 
     # Check YAML support
-    try:
-        import yaml
-        status["yaml_support"] = True
-    except ImportError:
-        pass
+    status["yaml_support"] = find_spec("yaml") is not None
 
     return status
 
 
+# CLI module, loaded by the first 'raptor parse-cairo' command and reused after
+_MAIN_MODULE = None
+
+
+def _load_main_module():
+    """
+    Load the plugin's __main__.py as a module, once per process.
+
+    Returns:
+        The loaded CLI module
+    """
+    global _MAIN_MODULE
+    if _MAIN_MODULE is None:
+        plugin_dir = Path(__file__).parent
+        sys.path.insert(0, str(plugin_dir))
+
+        # Load the __main__.py file as a module
+        import importlib.util
+        main_file = plugin_dir / '__main__.py'
+
+        spec = importlib.util.spec_from_file_location("cairo_parser_main", main_file)
+        parser_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(parser_module)
+        _MAIN_MODULE = parser_module
+
+    return _MAIN_MODULE
+
+
 def register_commands(subparsers):
     """
     Register CLI commands with raptor.
@@ -122,40 +167,30 @@ def register_commands(subparsers):
 
     def parse_cairo_handler(args):
         """Handle 'raptor parse-cairo' command."""
-        # Import and run the CLI module
-        plugin_dir = Path(__file__).parent
-        sys.path.insert(0, str(plugin_dir))
-
         try:
-            # Load the __main__.py file as a module
-            import importlib.util
-            main_file = plugin_dir / '__main__.py'
-
-            spec = importlib.util.spec_from_file_location("cairo_parser_main", main_file)
-            parser_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(parser_module)
+            # Import the CLI module
+            try:
+                parser_module = _load_main_module()
+            except (ImportError, OSError) as e:
+                # The CLI module could not be found or loaded
+                print(f"Error running Cairo parser: {e}")
+                return 1
 
-            # Build new argv for the parser
-            saved_argv = sys.argv
-            sys.argv = ['cairo_parser'] + args.paths
+            # Build argv for the parser
+            argv = list(args.paths)
 
             if args.format != 'json':
-                sys.argv.extend(['--format', args.format])
+                argv.extend(['--format', args.format])
             if args.output:
-                sys.argv.extend(['--output', args.output])
+                argv.extend(['--output', args.output])
             if args.no_stub:
-                sys.argv.append('--no-stub')
+                argv.append('--no-stub')
             if args.stub_report:
-                sys.argv.append('--stub-report')
+                argv.append('--stub-report')
             if args.quiet:
-                sys.argv.append('--quiet')
-
-            result = parser_module.main()
-
-            # Restore argv
-            sys.argv = saved_argv
+                argv.append('--quiet')
 
-            return result
+            return parser_module.main(argv)
         except Exception as e:
             print(f"Error running Cairo parser: {e}")
             import traceback